@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from sys import intern
+from typing import Final
 
-FTMS_SERVICE_UUID = "00001826-0000-1000-8000-00805f9b34fb"
-INDOOR_BIKE_DATA_CHAR_UUID = "00002ad2-0000-1000-8000-00805f9b34fb"
-FITNESS_MACHINE_CONTROL_POINT_CHAR_UUID = "00002ad9-0000-1000-8000-00805f9b34fb"
-SUPPORTED_POWER_RANGE_CHAR_UUID = "00002ad8-0000-1000-8000-00805f9b34fb"
-CYCLING_POWER_SERVICE_UUID = "00001818-0000-1000-8000-00805f9b34fb"
-CYCLING_POWER_MEASUREMENT_CHAR_UUID = "00002a63-0000-1000-8000-00805f9b34fb"
+FTMS_SERVICE_UUID: Final[str] = intern("00001826-0000-1000-8000-00805f9b34fb")
+INDOOR_BIKE_DATA_CHAR_UUID: Final[str] = intern("00002ad2-0000-1000-8000-00805f9b34fb")
+FITNESS_MACHINE_CONTROL_POINT_CHAR_UUID: Final[str] = intern(
+    "00002ad9-0000-1000-8000-00805f9b34fb"
+)
+SUPPORTED_POWER_RANGE_CHAR_UUID: Final[str] = intern("00002ad8-0000-1000-8000-00805f9b34fb")
+CYCLING_POWER_SERVICE_UUID: Final[str] = intern("00001818-0000-1000-8000-00805f9b34fb")
+CYCLING_POWER_MEASUREMENT_CHAR_UUID: Final[str] = intern(
+    "00002a63-0000-1000-8000-00805f9b34fb"
+)
 
 # Fitness Machine Control Point opcodes (FTMS)
 OP_REQUEST_CONTROL = 0x00
@@ -32,8 +39,14 @@ FLAG_METABOLIC_EQUIVALENT_PRESENT = 1 << 10
 FLAG_ELAPSED_TIME_PRESENT = 1 << 11
 FLAG_REMAINING_TIME_PRESENT = 1 << 12
 
+# Cycling Power Measurement flags (fields preceding crank revolution data)
+CPM_FLAG_PEDAL_POWER_BALANCE_PRESENT = 1 << 0
+CPM_FLAG_ACCUMULATED_TORQUE_PRESENT = 1 << 2
+CPM_FLAG_WHEEL_REVOLUTION_DATA_PRESENT = 1 << 4
+CPM_FLAG_CRANK_REVOLUTION_DATA_PRESENT = 1 << 5
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class IndoorBikeDataFlags:
     more_data: bool
     average_speed_present: bool
@@ -50,20 +63,27 @@ class IndoorBikeDataFlags:
     remaining_time_present: bool
 
 
+INDOOR_BIKE_FLAGS_MASK = (1 << 13) - 1
+
+# (field name, flag bit) pairs for formatting a raw flag word without decoding it.
+INDOOR_BIKE_FLAG_NAMES: tuple[tuple[str, int], ...] = tuple(
+    (field.name, 1 << bit) for bit, field in enumerate(fields(IndoorBikeDataFlags))
+)
+
+
+# Trainers send only a few distinct flag words, so each decode is built on first
+# use and shared afterwards (at most 2**13 entries, since reserved bits are masked).
+@lru_cache(maxsize=None)
+def _build_indoor_bike_flags(raw_flags: int) -> IndoorBikeDataFlags:
+    # Fields are declared in bit order, so a single binary format expands all
+    # 13 bits at once (LSB first) instead of masking each flag separately.
+    bits = format(raw_flags, "013b")[::-1]
+    return IndoorBikeDataFlags(*(bit == "1" for bit in bits))
+
+
 def parse_indoor_bike_flags(raw_flags: int) -> IndoorBikeDataFlags:
-    """Decode FTMS Indoor Bike Data flags into a typed structure."""
-    return IndoorBikeDataFlags(
-        more_data=bool(raw_flags & FLAG_MORE_DATA),
-        average_speed_present=bool(raw_flags & FLAG_AVERAGE_SPEED_PRESENT),
-        instantaneous_cadence_present=bool(raw_flags & FLAG_INSTANTANEOUS_CADENCE_PRESENT),
-        average_cadence_present=bool(raw_flags & FLAG_AVERAGE_CADENCE_PRESENT),
-        total_distance_present=bool(raw_flags & FLAG_TOTAL_DISTANCE_PRESENT),
-        resistance_level_present=bool(raw_flags & FLAG_RESISTANCE_LEVEL_PRESENT),
-        instantaneous_power_present=bool(raw_flags & FLAG_INSTANTANEOUS_POWER_PRESENT),
-        average_power_present=bool(raw_flags & FLAG_AVERAGE_POWER_PRESENT),
-        expended_energy_present=bool(raw_flags & FLAG_EXPENDED_ENERGY_PRESENT),
-        heart_rate_present=bool(raw_flags & FLAG_HEART_RATE_PRESENT),
-        metabolic_equivalent_present=bool(raw_flags & FLAG_METABOLIC_EQUIVALENT_PRESENT),
-        elapsed_time_present=bool(raw_flags & FLAG_ELAPSED_TIME_PRESENT),
-        remaining_time_present=bool(raw_flags & FLAG_REMAINING_TIME_PRESENT),
-    )
+    """Decode FTMS Indoor Bike Data flags into a typed structure.
+
+    Reserved upper bits are ignored; the returned instances are shared.
+    """
+    return _build_indoor_bike_flags(raw_flags & INDOOR_BIKE_FLAGS_MASK)
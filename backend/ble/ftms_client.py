@@ -5,23 +5,44 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import importlib
+import inspect
 import math
 import random
+import re
 import struct
-from dataclasses import asdict
+import time
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Optional
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping, NamedTuple, Optional
 
 from backend.ble.constants import (
+    CPM_FLAG_ACCUMULATED_TORQUE_PRESENT,
+    CPM_FLAG_CRANK_REVOLUTION_DATA_PRESENT,
+    CPM_FLAG_PEDAL_POWER_BALANCE_PRESENT,
+    CPM_FLAG_WHEEL_REVOLUTION_DATA_PRESENT,
     CYCLING_POWER_MEASUREMENT_CHAR_UUID,
     FITNESS_MACHINE_CONTROL_POINT_CHAR_UUID,
+    FLAG_AVERAGE_CADENCE_PRESENT,
+    FLAG_AVERAGE_POWER_PRESENT,
+    FLAG_AVERAGE_SPEED_PRESENT,
+    FLAG_ELAPSED_TIME_PRESENT,
+    FLAG_EXPENDED_ENERGY_PRESENT,
+    FLAG_HEART_RATE_PRESENT,
+    FLAG_INSTANTANEOUS_CADENCE_PRESENT,
+    FLAG_INSTANTANEOUS_POWER_PRESENT,
+    FLAG_METABOLIC_EQUIVALENT_PRESENT,
+    FLAG_MORE_DATA,
+    FLAG_REMAINING_TIME_PRESENT,
+    FLAG_RESISTANCE_LEVEL_PRESENT,
+    FLAG_TOTAL_DISTANCE_PRESENT,
     FTMS_SERVICE_UUID,
     INDOOR_BIKE_DATA_CHAR_UUID,
+    INDOOR_BIKE_FLAG_NAMES,
+    INDOOR_BIKE_FLAGS_MASK,
     OP_REQUEST_CONTROL,
     OP_START_RESUME,
     OP_SET_TARGET_POWER,
     SUPPORTED_POWER_RANGE_CHAR_UUID,
-    parse_indoor_bike_flags,
 )
 
 _bleak: Any
@@ -31,9 +52,75 @@ except ImportError:  # pragma: no cover - runtime dependency guard
     _bleak = None
 
 
+# Precompiled little-endian layouts for the FTMS/CPM fields decoded per notification.
+_S16_PACK = struct.Struct("<h").pack
+_POWER_RANGE_UNPACK = struct.Struct("<hhH").unpack_from
+_CPM_HEADER_UNPACK = struct.Struct("<Hh").unpack_from
+_CRANK_DATA_UNPACK = struct.Struct("<HH").unpack_from
+
+# CPM crank event time is in 1/1024 s units.
+_CRANK_TICKS_PER_MINUTE = 60.0 * 1024.0
+
+# Identical merged samples published within this window are coalesced.
+_PUBLISH_COALESCE_NS = 20_000_000
+
+# Simulator oscillators, periods in ticks: power (5, 11) then cadence (3.8, 8.5).
+# Each (sin, cos) pair is advanced by a fixed rotation per tick,
+# sin(u + d) = sin(u)cos(d) + cos(u)sin(d), so no sine is evaluated per tick.
+_SIM_WAVE_ROTATIONS: tuple[tuple[float, float], ...] = tuple(
+    (math.sin(1.0 / period), math.cos(1.0 / period)) for period in (5.0, 11.0, 3.8, 8.5)
+)
+
+# Per-tick (power base, power span, cadence base, cadence span) offsets drawn
+# as base + span * random() while a mode is active; steady mode has none.
+_SIM_MODE_OFFSETS: Mapping[str, tuple[float, float, float, float]] = MappingProxyType(
+    {
+        "surge": (20.0, 35.0, 4.0, 7.0),
+        "recovery": (-15.0, -25.0, -5.0, -7.0),
+    }
+)
+
+_SIM_NOISE_BLOCK_TICKS = 512
+
+
+def _sim_step(
+    power: float,
+    cadence: float,
+    speed: float,
+    target_watts: int,
+    mode_offset: float,
+    cadence_mode_offset: float,
+    periodic: float,
+    cadence_periodic: float,
+    noise: tuple[float, float, float],
+) -> tuple[float, float, float]:
+    """Advance simulated (power, cadence, speed) by one tick.
+
+    Pure numeric step with no client state, kept separate from the async loop.
+    """
+    power_noise, cadence_noise, speed_noise = noise
+    dynamic_target = max(
+        50.0, min(1200.0, target_watts + mode_offset + periodic + power_noise)
+    )
+    power += max(-30.0, min(30.0, (dynamic_target - power) * 0.30))
+    if abs(power - dynamic_target) < 1.0:
+        power = dynamic_target
+
+    cadence_target = (
+        70.0 + (power / 8.8) + cadence_mode_offset + cadence_periodic + cadence_noise
+    )
+    speed_target = 14.0 + (power / 11.0) + speed_noise
+    cadence += max(-5.5, min(5.5, (cadence_target - cadence) * 0.55))
+    speed += max(-2.8, min(2.8, (speed_target - speed) * 0.40))
+    return power, max(45.0, min(128.0, cadence)), max(7.0, min(78.0, speed))
+
+
 MetricsCallback = Callable[["IndoorBikeData"], Awaitable[None] | None]
 
-_BLE_COMPANY_IDS: dict[int, str] = {
+# Minimum spacing between "metrics callback failed" reports.
+_CALLBACK_ERROR_LOG_INTERVAL_SEC = 10.0
+
+_BLE_COMPANY_IDS: Mapping[int, str] = MappingProxyType({
     0x004C: "Apple",
     0x0006: "Microsoft",
     0x000F: "Broadcom",
@@ -42,7 +129,7 @@ _BLE_COMPANY_IDS: dict[int, str] = {
     0x00D2: "Wahoo Fitness",
     0x011F: "Tacx",
     0x04D8: "Elite",
-}
+})
 
 _BRAND_HINTS: tuple[tuple[str, str], ...] = (
     ("wahoo", "Wahoo Fitness"),
@@ -58,23 +145,31 @@ _BRAND_HINTS: tuple[tuple[str, str], ...] = (
     ("zwift", "Zwift"),
 )
 
+# Zero-width lookahead so overlapping hints are all seen; the earliest entry
+# of _BRAND_HINTS among them wins, wherever it sits in the name.
+_BRAND_HINT_RE = re.compile(
+    "(?=(" + "|".join(re.escape(hint) for hint, _ in _BRAND_HINTS) + "))", re.IGNORECASE
+)
+_BRAND_HINT_PRIORITY: dict[str, int] = {hint: i for i, (hint, _) in enumerate(_BRAND_HINTS)}
+
 
 def _resolve_manufacturer(
     name: str, manufacturer_data: Any | None
 ) -> str | None:
     if isinstance(manufacturer_data, dict) and manufacturer_data:
-        for key in sorted(manufacturer_data.keys()):
-            if isinstance(key, int):
-                return _BLE_COMPANY_IDS.get(key, f"MFG 0x{key:04X}")
-    lowered = name.lower()
-    for hint, brand in _BRAND_HINTS:
-        if hint in lowered:
-            return brand
-    return None
+        key = min((k for k in manufacturer_data if isinstance(k, int)), default=None)
+        if key is not None:
+            return _BLE_COMPANY_IDS.get(key, f"MFG 0x{key:04X}")
+    priority = min(
+        (_BRAND_HINT_PRIORITY[match.group(1).lower()] for match in _BRAND_HINT_RE.finditer(name)),
+        default=None,
+    )
+    if priority is None:
+        return None
+    return _BRAND_HINTS[priority][1]
 
 
-@dataclass(frozen=True)
-class ScannedDevice:
+class ScannedDevice(NamedTuple):
     name: str
     address: str
     rssi: int
@@ -82,13 +177,22 @@ class ScannedDevice:
     manufacturer: str | None = None
 
 
-@dataclass(frozen=True)
-class IndoorBikeData:
+class IndoorBikeData(NamedTuple):
     instantaneous_power: Optional[int] = None
     instantaneous_cadence: Optional[float] = None
     instantaneous_speed_kmh: Optional[float] = None
 
 
+_EMPTY_INDOOR_BIKE_DATA = IndoorBikeData()
+
+
+def _advertises_ftms(adv_data: Any) -> bool:
+    return any(
+        service_uuid.lower() == FTMS_SERVICE_UUID
+        for service_uuid in (adv_data.service_uuids or ())
+    )
+
+
 def _ensure_bleak_available() -> None:
     if _bleak is None:
         raise RuntimeError(
@@ -96,134 +200,237 @@ def _ensure_bleak_available() -> None:
         )
 
 
-def _require_bytes(data: bytes, cursor: int, size: int) -> None:
-    if cursor + size > len(data):
-        raise ValueError(
-            f"Invalid Indoor Bike Data payload: expected {size} bytes at offset {cursor}"
-        )
+# Indoor Bike Data fields following instantaneous speed, in payload order.
+_INDOOR_BIKE_FIELD_WIDTHS: tuple[tuple[int, int], ...] = (
+    (FLAG_AVERAGE_SPEED_PRESENT, 2),
+    (FLAG_INSTANTANEOUS_CADENCE_PRESENT, 2),
+    (FLAG_AVERAGE_CADENCE_PRESENT, 2),
+    (FLAG_TOTAL_DISTANCE_PRESENT, 3),
+    (FLAG_RESISTANCE_LEVEL_PRESENT, 2),
+    (FLAG_INSTANTANEOUS_POWER_PRESENT, 2),
+    (FLAG_AVERAGE_POWER_PRESENT, 2),
+    (FLAG_EXPENDED_ENERGY_PRESENT, 5),
+    (FLAG_HEART_RATE_PRESENT, 1),
+    (FLAG_METABOLIC_EQUIVALENT_PRESENT, 1),
+    (FLAG_ELAPSED_TIME_PRESENT, 2),
+    (FLAG_REMAINING_TIME_PRESENT, 2),
+)
+
+
+def _indoor_bike_layout(raw_flags: int) -> tuple[int, int, int]:
+    """Return (cadence offset, power offset, size) of the fields after speed.
+
+    Offsets are -1 when the field is absent.
+    """
+    cadence_offset = -1
+    power_offset = -1
+    size = 0
+    for flag, width in _INDOOR_BIKE_FIELD_WIDTHS:
+        if raw_flags & flag:
+            if flag == FLAG_INSTANTANEOUS_CADENCE_PRESENT:
+                cadence_offset = size
+            elif flag == FLAG_INSTANTANEOUS_POWER_PRESENT:
+                power_offset = size
+            size += width
+    return cadence_offset, power_offset, size
+
+
+# Every flag word maps to a fixed layout, so payload size is checked once per decode.
+# Trainers send only a few distinct words, so layouts are computed on first use.
+_INDOOR_BIKE_LAYOUTS: dict[int, tuple[int, int, int]] = {}
+
+# Whole-payload layouts (speed, cadence, power) for the flag words trainers send
+# on nearly every notification, decoded in one unpack call.
+_INDOOR_BIKE_FAST_LAYOUTS: dict[int, struct.Struct] = {
+    FLAG_INSTANTANEOUS_CADENCE_PRESENT | FLAG_INSTANTANEOUS_POWER_PRESENT: (
+        struct.Struct("<2xHHh")
+    ),
+    FLAG_INSTANTANEOUS_CADENCE_PRESENT
+    | FLAG_RESISTANCE_LEVEL_PRESENT
+    | FLAG_INSTANTANEOUS_POWER_PRESENT: struct.Struct("<2xHH2xh"),
+    FLAG_INSTANTANEOUS_CADENCE_PRESENT
+    | FLAG_INSTANTANEOUS_POWER_PRESENT
+    | FLAG_HEART_RATE_PRESENT: struct.Struct("<2xHHhx"),
+    FLAG_INSTANTANEOUS_CADENCE_PRESENT
+    | FLAG_RESISTANCE_LEVEL_PRESENT
+    | FLAG_INSTANTANEOUS_POWER_PRESENT
+    | FLAG_HEART_RATE_PRESENT: struct.Struct("<2xHH2xhx"),
+}
 
 
 def _decode_indoor_bike_data(
-    payload: bytes, *, speed_present: bool
+    payload: bytes | bytearray, *, speed_present: bool
 ) -> tuple[IndoorBikeData, int]:
-    raw_flags = struct.unpack_from("<H", payload, 0)[0]
-    flags = parse_indoor_bike_flags(raw_flags)
-    cursor = 2
+    # Single u16 fields are read by byte indexing: no struct call or result tuple.
+    raw_flags = payload[0] | payload[1] << 8
+    if speed_present:
+        fast_layout = _INDOOR_BIKE_FAST_LAYOUTS.get(raw_flags)
+        if fast_layout is not None and fast_layout.size <= len(payload):
+            raw_speed, raw_cadence, raw_power = fast_layout.unpack_from(payload, 0)
+            return IndoorBikeData(
+                instantaneous_power=raw_power,
+                instantaneous_cadence=raw_cadence / 2.0,
+                instantaneous_speed_kmh=raw_speed / 100.0,
+            ), fast_layout.size
+
+    layout_key = raw_flags & INDOOR_BIKE_FLAGS_MASK
+    layout = _INDOOR_BIKE_LAYOUTS.get(layout_key)
+    if layout is None:
+        layout = _INDOOR_BIKE_LAYOUTS[layout_key] = _indoor_bike_layout(layout_key)
+    cadence_offset, power_offset, size = layout
+    cursor = 4 if speed_present else 2
+    end = cursor + size
+    if end > len(payload):
+        raise ValueError(
+            f"Invalid Indoor Bike Data payload: expected {end} bytes, got {len(payload)}"
+        )
 
     speed_kmh: Optional[float] = None
     if speed_present:
-        _require_bytes(payload, cursor, 2)
-        raw_speed = struct.unpack_from("<H", payload, cursor)[0]
-        speed_kmh = raw_speed / 100.0
-        cursor += 2
-
-    if flags.average_speed_present:
-        _require_bytes(payload, cursor, 2)
-        cursor += 2
+        speed_kmh = (payload[2] | payload[3] << 8) / 100.0
 
     cadence: Optional[float] = None
-    if flags.instantaneous_cadence_present:
-        _require_bytes(payload, cursor, 2)
-        raw_cadence = struct.unpack_from("<H", payload, cursor)[0]
-        cadence = raw_cadence / 2.0
-        cursor += 2
-
-    if flags.average_cadence_present:
-        _require_bytes(payload, cursor, 2)
-        cursor += 2
+    if cadence_offset >= 0:
+        offset = cursor + cadence_offset
+        cadence = (payload[offset] | payload[offset + 1] << 8) / 2.0
 
-    if flags.total_distance_present:
-        _require_bytes(payload, cursor, 3)
-        cursor += 3
+    power: Optional[int] = None
+    if power_offset >= 0:
+        offset = cursor + power_offset
+        power = payload[offset] | payload[offset + 1] << 8
+        if power & 0x8000:
+            power -= 0x10000
+    elif cadence is None and speed_kmh is None:
+        return _EMPTY_INDOOR_BIKE_DATA, end
 
-    if flags.resistance_level_present:
-        _require_bytes(payload, cursor, 2)
-        cursor += 2
+    return IndoorBikeData(
+        instantaneous_power=power,
+        instantaneous_cadence=cadence,
+        instantaneous_speed_kmh=speed_kmh,
+    ), end
 
-    power: Optional[int] = None
-    if flags.instantaneous_power_present:
-        _require_bytes(payload, cursor, 2)
-        power = struct.unpack_from("<h", payload, cursor)[0]
-        cursor += 2
 
-    if flags.average_power_present:
-        _require_bytes(payload, cursor, 2)
-        cursor += 2
+# CPM fields preceding crank revolution data, in payload order.
+_CPM_PRECEDING_FIELD_WIDTHS: tuple[tuple[int, int], ...] = (
+    (CPM_FLAG_PEDAL_POWER_BALANCE_PRESENT, 1),
+    (CPM_FLAG_ACCUMULATED_TORQUE_PRESENT, 2),
+    (CPM_FLAG_WHEEL_REVOLUTION_DATA_PRESENT, 6),
+)
+_CPM_PRECEDING_FIELDS_MASK = (
+    CPM_FLAG_PEDAL_POWER_BALANCE_PRESENT
+    | CPM_FLAG_ACCUMULATED_TORQUE_PRESENT
+    | CPM_FLAG_WHEEL_REVOLUTION_DATA_PRESENT
+)
+# Crank data offset for every combination of the preceding fields.
+_CPM_CRANK_OFFSETS: tuple[int, ...] = tuple(
+    4 + sum(width for flag, width in _CPM_PRECEDING_FIELD_WIDTHS if flags & flag)
+    for flags in range(_CPM_PRECEDING_FIELDS_MASK + 1)
+)
 
-    if flags.expended_energy_present:
-        _require_bytes(payload, cursor, 5)
-        cursor += 5
 
-    if flags.heart_rate_present:
-        _require_bytes(payload, cursor, 1)
-        cursor += 1
+def _decode_cycling_power_measurement(
+    payload: bytes | bytearray,
+) -> tuple[Optional[int], Optional[int], Optional[int]]:
+    """Decode (power, crank revolutions, crank event time) from CPM payload (0x2A63).
 
-    if flags.metabolic_equivalent_present:
-        _require_bytes(payload, cursor, 1)
-        cursor += 1
+    Stateless byte decoding only; fields after the crank data never affect the
+    result, so they are not walked.
+    """
+    if len(payload) < 4:
+        return None, None, None
 
-    if flags.elapsed_time_present:
-        _require_bytes(payload, cursor, 2)
-        cursor += 2
+    flags, power = _CPM_HEADER_UNPACK(payload, 0)
+    if not flags & CPM_FLAG_CRANK_REVOLUTION_DATA_PRESENT:
+        return power, None, None
 
-    if flags.remaining_time_present:
-        _require_bytes(payload, cursor, 2)
-        cursor += 2
+    cursor = _CPM_CRANK_OFFSETS[flags & _CPM_PRECEDING_FIELDS_MASK]
+    if cursor + 4 > len(payload):
+        return power, None, None
 
-    return IndoorBikeData(
-        instantaneous_power=power,
-        instantaneous_cadence=cadence,
-        instantaneous_speed_kmh=speed_kmh,
-    ), cursor
+    crank_revs, crank_event_time = _CRANK_DATA_UNPACK(payload, cursor)
+    return power, crank_revs, crank_event_time
 
 
 def _plausibility_score(metrics: IndoorBikeData) -> int:
-    score = 0
-    if metrics.instantaneous_cadence is not None:
-        cadence = metrics.instantaneous_cadence
-        if cadence < 0 or cadence > 220:
-            score += 1000
-    if metrics.instantaneous_power is not None:
-        power = metrics.instantaneous_power
-        if power < -200 or power > 3000:
-            score += 1000
-    if metrics.instantaneous_speed_kmh is not None:
-        speed = metrics.instantaneous_speed_kmh
-        if speed < 0 or speed > 130:
-            score += 1000
-    return score
-
-
-def parse_indoor_bike_data(payload: bytes) -> IndoorBikeData:
-    """Parse FTMS Indoor Bike Data characteristic payload (0x2AD2)."""
+    power, cadence, speed = metrics
+    return 1000 * (
+        (cadence is not None and not 0 <= cadence <= 220)
+        + (power is not None and not -200 <= power <= 3000)
+        + (speed is not None and not 0 <= speed <= 130)
+    )
+
+
+@dataclass(frozen=True)
+class _IndoorBikeCandidate:
+    speed_present: bool
+    metrics: Optional[IndoorBikeData] = None
+    consumed: int = 0
+    score: int = 0
+    error: Optional[ValueError] = None
+
+
+def _parse_indoor_bike_candidates(
+    payload: bytes | bytearray, *, exhaustive: bool = False
+) -> list[_IndoorBikeCandidate]:
+    """Decode Indoor Bike Data at the spec alignment, then the alternate one if needed.
+
+    With ``exhaustive`` both alignments are always decoded (debug output).
+    """
     if len(payload) < 2:
         raise ValueError("Indoor Bike Data payload too short")
 
-    raw_flags = struct.unpack_from("<H", payload, 0)[0]
-    flags = parse_indoor_bike_flags(raw_flags)
+    raw_flags = payload[0] | payload[1] << 8
     # Most devices follow the spec: speed present when "more_data" is false.
     # Some devices are inconsistent in the wild, so try both alignments.
-    preferred_speed_present = not flags.more_data
-    candidates: list[tuple[int, int, IndoorBikeData]] = []
-    errors: list[Exception] = []
+    preferred_speed_present = not raw_flags & FLAG_MORE_DATA
+    candidates: list[_IndoorBikeCandidate] = []
 
     for speed_present in (preferred_speed_present, not preferred_speed_present):
         try:
-            metrics, cursor = _decode_indoor_bike_data(
+            metrics, consumed = _decode_indoor_bike_data(
                 payload, speed_present=speed_present
             )
-            score = _plausibility_score(metrics)
-            trailing_bytes = len(payload) - cursor
-            candidates.append((score, trailing_bytes, metrics))
         except ValueError as exc:
-            errors.append(exc)
-
-    if not candidates:
-        raise errors[0]
-
+            candidates.append(_IndoorBikeCandidate(speed_present, error=exc))
+            continue
+        score = _plausibility_score(metrics)
+        candidates.append(_IndoorBikeCandidate(speed_present, metrics, consumed, score))
+        if (
+            not exhaustive
+            and speed_present == preferred_speed_present
+            and score == 0
+            and consumed == len(payload)
+        ):
+            # Exact, plausible decode at the spec alignment: skip the alternate one.
+            break
+    return candidates
+
+
+def _pick_indoor_bike_candidate(candidates: list[_IndoorBikeCandidate]) -> IndoorBikeData:
     # Prefer plausible values, then tighter decode (fewer trailing bytes).
-    candidates.sort(key=lambda item: (item[0], item[1]))
-    return candidates[0][2]
+    best: Optional[IndoorBikeData] = None
+    best_score = 0
+    best_consumed = 0
+    for candidate in candidates:
+        if candidate.metrics is None:
+            continue
+        if (
+            best is None
+            or candidate.score < best_score
+            or (candidate.score == best_score and candidate.consumed > best_consumed)
+        ):
+            best = candidate.metrics
+            best_score = candidate.score
+            best_consumed = candidate.consumed
+
+    if best is None:
+        raise candidates[0].error or ValueError("Invalid Indoor Bike Data payload")
+    return best
+
+
+def parse_indoor_bike_data(payload: bytes | bytearray) -> IndoorBikeData:
+    """Parse FTMS Indoor Bike Data characteristic payload (0x2AD2)."""
+    return _pick_indoor_bike_candidate(_parse_indoor_bike_candidates(payload))
 
 
 def normalize_power_target(
@@ -233,9 +440,10 @@ def normalize_power_target(
         increment_watts = 1
 
     clamped = min(max(requested_watts, min_watts), max_watts)
-    steps = round((clamped - min_watts) / increment_watts)
-    normalized = min_watts + (steps * increment_watts)
-    return min(max(normalized, min_watts), max_watts)
+    # Integer round-half-up; rounding up can only overshoot max_watts, which
+    # caps the result even when it is off the increment grid.
+    steps = (clamped - min_watts + increment_watts // 2) // increment_watts
+    return min(min_watts + (steps * increment_watts), max_watts)
 
 
 class FTMSClient:
@@ -248,7 +456,13 @@ class FTMSClient:
         ble_pair: bool = True,
     ) -> None:
         self._client: Optional[Any] = None
-        self._metrics_callback: Optional[MetricsCallback] = None
+        self._dispatch_metrics: Optional[Callable[[IndoorBikeData], object]] = None
+        self._metrics_queue: Optional[asyncio.Queue[Awaitable[object]]] = None
+        self._metrics_consumer_task: Optional[asyncio.Task[None]] = None
+        self._callback_error_logged_at: Optional[float] = None
+        self._callback_errors_suppressed = 0
+        self._last_published: Optional[IndoorBikeData] = None
+        self._last_publish_ns = 0
         self._debug_ftms = debug_ftms
         self._simulate_ht = simulate_ht
         self._ble_pair = ble_pair
@@ -260,6 +474,8 @@ class FTMSClient:
         self._last_crank_revs: Optional[int] = None
         self._last_crank_event_time: Optional[int] = None
         self._supported_power_range: Optional[tuple[int, int, int]] = None
+        # Set once the range has been read, successfully or not, until disconnect.
+        self._supported_power_range_read = False
         self._control_point_indications_enabled = False
         self._sim_connected = False
         self._sim_target_watts = 120
@@ -268,9 +484,14 @@ class FTMSClient:
         self._sim_speed = 28.0
         self._sim_task: Optional[asyncio.Task[None]] = None
         self._sim_rng = random.Random(20260225)
-        self._sim_tick = 0
+        # (sin, cos) of tick / period for each _SIM_WAVE_ROTATIONS oscillator.
+        self._sim_waves = [(0.0, 1.0)] * len(_SIM_WAVE_ROTATIONS)
+        self._sim_noise: list[tuple[float, float, float]] = []
+        self._sim_noise_index = 0
         self._sim_mode: str = "steady"
         self._sim_mode_remaining = 0
+        # _SIM_MODE_OFFSETS entry for _sim_mode, resolved at each mode switch.
+        self._sim_mode_offsets: Optional[tuple[float, float, float, float]] = None
         self._scan_cache: dict[str, Any] = {}
         self._services_discovered = False
 
@@ -299,8 +520,7 @@ class FTMSClient:
         self._scan_cache = {}
 
         for _, (device, adv_data) in discovered.items():
-            uuids = {u.lower() for u in (adv_data.service_uuids or [])}
-            has_ftms = FTMS_SERVICE_UUID in uuids
+            has_ftms = _advertises_ftms(adv_data)
             self._scan_cache[device.address.lower()] = device
             manufacturer = _resolve_manufacturer(
                 device.name or "",
@@ -371,18 +591,22 @@ class FTMSClient:
                 with contextlib.suppress(asyncio.CancelledError):
                     await self._sim_task
                 self._sim_task = None
+            await self._stop_metrics_consumer()
             return
 
+        await self._stop_metrics_consumer()
         if self._client:
             await self._client.disconnect()
             self._client = None
             self._services_discovered = False
+            self._supported_power_range = None
+            self._supported_power_range_read = False
 
     async def subscribe_indoor_bike_data(self, callback: MetricsCallback) -> None:
         if self._simulate_ht:
             if not self._sim_connected:
                 raise RuntimeError("Not connected")
-            self._metrics_callback = callback
+            self._set_metrics_callback(callback)
             if self._sim_task is None or self._sim_task.done():
                 self._sim_task = asyncio.create_task(self._simulation_loop())
             return
@@ -391,7 +615,7 @@ class FTMSClient:
             raise RuntimeError("Not connected")
 
         await self._ensure_services_discovered()
-        self._metrics_callback = callback
+        self._set_metrics_callback(callback)
         subscribed_any = False
 
         try:
@@ -424,6 +648,74 @@ class FTMSClient:
                 "(expected 0x2AD2 and/or 0x2A63)"
             )
 
+    def _set_metrics_callback(self, callback: MetricsCallback) -> None:
+        # Specialized once here: awaitables returned by the callback are queued
+        # to a single consumer task (no Task per sample, awaited in order). Only
+        # callables that are not coroutine functions need their result checked,
+        # e.g. a lambda or partial wrapping one.
+        self._discard_metrics_consumer()
+        if inspect.iscoroutinefunction(callback):
+            async_callback = callback
+
+            def dispatch(metrics: IndoorBikeData) -> None:
+                self._queue_metrics_awaitable(async_callback(metrics))
+        else:
+            def dispatch(metrics: IndoorBikeData) -> None:
+                result = callback(metrics)
+                if inspect.isawaitable(result):
+                    self._queue_metrics_awaitable(result)
+
+        self._dispatch_metrics = dispatch
+
+    def _queue_metrics_awaitable(self, awaitable: Awaitable[object]) -> None:
+        queue = self._metrics_queue
+        if queue is None:
+            queue = self._metrics_queue = asyncio.Queue()
+            self._metrics_consumer_task = asyncio.create_task(self._consume_metrics(queue))
+        queue.put_nowait(awaitable)
+
+    async def _consume_metrics(self, queue: asyncio.Queue[Awaitable[object]]) -> None:
+        while True:
+            awaitable = await queue.get()
+            try:
+                await awaitable
+            except Exception as exc:  # keep delivering later samples
+                self._report_callback_error(exc)
+
+    def _report_callback_error(self, exc: Exception) -> None:
+        now = time.monotonic()
+        last = self._callback_error_logged_at
+        if last is not None and now - last < _CALLBACK_ERROR_LOG_INTERVAL_SEC:
+            self._callback_errors_suppressed += 1
+            return
+        suppressed = self._callback_errors_suppressed
+        self._callback_error_logged_at = now
+        self._callback_errors_suppressed = 0
+        note = f" ({suppressed} similar errors suppressed)" if suppressed else ""
+        print(f"[FTMS] metrics callback failed: {exc!r}{note}")
+
+    def _discard_metrics_consumer(self) -> Optional[asyncio.Task[None]]:
+        """Cancel the consumer task and close queued coroutines it will never await."""
+        task = self._metrics_consumer_task
+        queue = self._metrics_queue
+        self._metrics_consumer_task = None
+        self._metrics_queue = None
+        if task is not None:
+            task.cancel()
+        while queue is not None and not queue.empty():
+            pending = queue.get_nowait()
+            if inspect.iscoroutine(pending):
+                pending.close()
+        return task
+
+    async def _stop_metrics_consumer(self) -> None:
+        self._dispatch_metrics = None
+        task = self._discard_metrics_consumer()
+        if task is None:
+            return
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
     async def set_target_power(self, watts: int) -> int:
         """Set fixed ERG target power through FTMS Control Point."""
         if self._simulate_ht:
@@ -442,24 +734,32 @@ class FTMSClient:
         target_watts = await self._normalize_target_power(watts)
         request_control = bytes([OP_REQUEST_CONTROL])
         start_resume = bytes([OP_START_RESUME])
-        set_target_power = bytes([OP_SET_TARGET_POWER]) + struct.pack("<h", target_watts)
+        set_target_power = bytes([OP_SET_TARGET_POWER]) + _S16_PACK(target_watts)
 
         errors: list[Exception] = []
-        sequences = [
-            [request_control, start_resume, set_target_power],
-            [request_control, set_target_power],
-            [set_target_power],
+        # (commands, acknowledge every command). The FTMS control point is normally
+        # Write + Indicate only; when a trainer also advertises write-without-response,
+        # the first attempt only waits for the final write response (writes are ordered
+        # on the link). Fully acknowledged sequences keep the 50 ms command spacing.
+        sequences: list[tuple[list[bytes], bool]] = []
+        if self._control_point_allows_write_without_response():
+            sequences.append(([request_control, start_resume, set_target_power], False))
+        sequences += [
+            ([request_control, start_resume, set_target_power], True),
+            ([request_control, set_target_power], True),
+            ([set_target_power], True),
         ]
 
-        for sequence in sequences:
+        for sequence, acknowledge_all in sequences:
             try:
                 for i, command in enumerate(sequence):
+                    last = i == len(sequence) - 1
                     await self._client.write_gatt_char(
                         FITNESS_MACHINE_CONTROL_POINT_CHAR_UUID,
                         command,
-                        response=True,
+                        response=acknowledge_all or last,
                     )
-                    if i < len(sequence) - 1:
+                    if acknowledge_all and not last:
                         await asyncio.sleep(0.05)
                 return target_watts
             except Exception as exc:  # pragma: no cover - BLE runtime variability
@@ -469,6 +769,19 @@ class FTMSClient:
             f"Unable to set ERG target to {target_watts}W via FTMS Control Point"
         ) from errors[-1]
 
+    def _control_point_allows_write_without_response(self) -> bool:
+        if not self._client:
+            return False
+        try:
+            characteristic = self._client.services.get_characteristic(
+                FITNESS_MACHINE_CONTROL_POINT_CHAR_UUID
+            )
+        except Exception:  # pragma: no cover - backend without resolved services
+            return False
+        return characteristic is not None and (
+            "write-without-response" in characteristic.properties
+        )
+
     async def probe_erg_support(self) -> bool:
         """Best-effort check that FTMS control point accepts ERG control commands."""
         if self._simulate_ht:
@@ -539,9 +852,8 @@ class FTMSClient:
                 print(f"[FTMS] control point indications unavailable: {exc}")
 
     def _handle_control_point_indication(
-        self, _sender: object, data: bytearray
+        self, _sender: object, payload: bytearray
     ) -> None:
-        payload = bytes(data)
         if not self._debug_ftms:
             return
         if len(payload) >= 3 and payload[0] == 0x80:
@@ -577,25 +889,13 @@ class FTMSClient:
         if self._simulate_ht:
             return (50, 1200, 5)
 
-        if self._supported_power_range is not None:
+        if self._supported_power_range_read:
             return self._supported_power_range
 
         if not self._client:
             return None
 
-    async def _ensure_services_discovered(self) -> None:
-        if self._simulate_ht:
-            return
-        if not self._client:
-            return
-        if self._services_discovered:
-            return
-        if hasattr(self._client, "get_services"):
-            await self._client.get_services()
-        else:
-            _ = self._client.services
-        self._services_discovered = True
-
+        self._supported_power_range_read = True
         try:
             raw = bytes(
                 await self._client.read_gatt_char(SUPPORTED_POWER_RANGE_CHAR_UUID)
@@ -610,7 +910,7 @@ class FTMSClient:
                 print(f"[FTMS] supported power range payload too short: {raw.hex(' ')}")
             return None
 
-        min_watts, max_watts, increment_watts = struct.unpack_from("<hhH", raw, 0)
+        min_watts, max_watts, increment_watts = _POWER_RANGE_UNPACK(raw, 0)
         if increment_watts <= 0:
             increment_watts = 1
 
@@ -622,6 +922,19 @@ class FTMSClient:
             )
         return self._supported_power_range
 
+    async def _ensure_services_discovered(self) -> None:
+        if self._simulate_ht:
+            return
+        if not self._client:
+            return
+        if self._services_discovered:
+            return
+        if hasattr(self._client, "get_services"):
+            await self._client.get_services()
+        else:
+            _ = self._client.services
+        self._services_discovered = True
+
     async def _resolve_device(
         self, target: Optional[str], timeout: float
     ) -> Optional[Any]:
@@ -636,50 +949,42 @@ class FTMSClient:
             )
             return device
 
-        discovered = await _bleak.BleakScanner.discover(
-            timeout=timeout, return_adv=True
+        # Returns on the first FTMS advertisement instead of scanning the full timeout;
+        # service_uuids lets the OS stack filter advertisements where supported.
+        return await _bleak.BleakScanner.find_device_by_filter(
+            lambda _device, adv_data: _advertises_ftms(adv_data),
+            timeout=timeout,
+            service_uuids=[FTMS_SERVICE_UUID],
         )
-        for _, (device, adv_data) in discovered.items():
-            uuids = {u.lower() for u in (adv_data.service_uuids or [])}
-            if FTMS_SERVICE_UUID in uuids:
-                return device
-        return None
 
     def _handle_indoor_bike_data_notification(
-        self, _sender: object, data: bytearray
+        self, _sender: object, payload: bytearray
     ) -> None:
-        payload = bytes(data)
-        metrics = parse_indoor_bike_data(payload)
+        if not self._debug_ftms:
+            metrics = parse_indoor_bike_data(payload)
+        else:
+            candidates = _parse_indoor_bike_candidates(payload, exhaustive=True)
+            metrics = _pick_indoor_bike_candidate(candidates)
         self._last_ftms_power = metrics.instantaneous_power
         self._last_ftms_cadence = metrics.instantaneous_cadence
         self._last_ftms_speed = metrics.instantaneous_speed_kmh
         if self._debug_ftms:
-            raw_flags = struct.unpack_from("<H", payload, 0)[0] if len(payload) >= 2 else 0
-            flags = parse_indoor_bike_flags(raw_flags)
+            raw_flags = payload[0] | payload[1] << 8
             flags_repr = ",".join(
-                name for name, enabled in asdict(flags).items() if enabled
+                name for name, bit in INDOOR_BIKE_FLAG_NAMES if raw_flags & bit
             ) or "-"
-            preferred_speed_present = not flags.more_data
             candidates_repr: list[str] = []
-            for speed_present in (preferred_speed_present, not preferred_speed_present):
-                try:
-                    candidate_metrics, consumed = _decode_indoor_bike_data(
-                        payload, speed_present=speed_present
-                    )
-                    score = _plausibility_score(candidate_metrics)
-                    candidates_repr.append(
-                        "speed="
-                        + ("yes" if speed_present else "no")
-                        + f"/score={score}/used={consumed}"
-                        + f"/p={candidate_metrics.instantaneous_power}"
-                        + f"/c={candidate_metrics.instantaneous_cadence}"
-                    )
-                except ValueError as exc:
-                    candidates_repr.append(
-                        "speed="
-                        + ("yes" if speed_present else "no")
-                        + f"/err={exc}"
-                    )
+            for candidate in candidates:
+                speed_repr = "speed=" + ("yes" if candidate.speed_present else "no")
+                if candidate.metrics is None:
+                    candidates_repr.append(f"{speed_repr}/err={candidate.error}")
+                    continue
+                candidates_repr.append(
+                    speed_repr
+                    + f"/score={candidate.score}/used={candidate.consumed}"
+                    + f"/p={candidate.metrics.instantaneous_power}"
+                    + f"/c={candidate.metrics.instantaneous_cadence}"
+                )
             print(
                 f"[FTMS] flags=0x{raw_flags:04X} [{flags_repr}] "
                 f"payload={payload.hex(' ')} "
@@ -691,9 +996,8 @@ class FTMSClient:
         self._publish_merged_metrics()
 
     def _handle_cycling_power_measurement_notification(
-        self, _sender: object, data: bytearray
+        self, _sender: object, payload: bytearray
     ) -> None:
-        payload = bytes(data)
         power, cadence = self._parse_cycling_power_measurement(payload)
         self._last_cycling_power = power
         if cadence is not None:
@@ -708,7 +1012,7 @@ class FTMSClient:
         self._publish_merged_metrics()
 
     def _publish_merged_metrics(self) -> None:
-        if self._metrics_callback is None:
+        if self._dispatch_metrics is None:
             return
 
         power = (
@@ -723,175 +1027,137 @@ class FTMSClient:
         elif cadence is None or cadence == 0.0:
             cadence = self._last_cycling_cadence
 
+        if power is None and cadence is None and self._last_ftms_speed is None:
+            # Nothing to report yet.
+            return
+
         merged = IndoorBikeData(
             instantaneous_power=power,
             instantaneous_cadence=cadence,
             instantaneous_speed_kmh=self._last_ftms_speed,
         )
-        maybe_coro = self._metrics_callback(merged)
-        if asyncio.iscoroutine(maybe_coro):
-            asyncio.create_task(maybe_coro)
+        now_ns = time.monotonic_ns()
+        if (
+            now_ns - self._last_publish_ns < _PUBLISH_COALESCE_NS
+            and merged == self._last_published
+        ):
+            # FTMS + CPM notifications of the same sample: publish it only once.
+            return
+        self._last_publish_ns = now_ns
+        self._last_published = merged
+
+        self._dispatch_metrics(merged)
 
     def _parse_cycling_power_measurement(
-        self, payload: bytes
+        self, payload: bytes | bytearray
     ) -> tuple[Optional[int], Optional[float]]:
-        if len(payload) < 4:
-            return None, None
-
-        flags = struct.unpack_from("<H", payload, 0)[0]
-        power = struct.unpack_from("<h", payload, 2)[0]
-        cursor = 4
-
-        pedal_power_balance_present = bool(flags & (1 << 0))
-        accumulated_torque_present = bool(flags & (1 << 2))
-        wheel_revolution_data_present = bool(flags & (1 << 4))
-        crank_revolution_data_present = bool(flags & (1 << 5))
-        extreme_force_magnitudes_present = bool(flags & (1 << 6))
-        extreme_torque_magnitudes_present = bool(flags & (1 << 7))
-        extreme_angles_present = bool(flags & (1 << 8))
-        top_dead_spot_angle_present = bool(flags & (1 << 9))
-        bottom_dead_spot_angle_present = bool(flags & (1 << 10))
-        accumulated_energy_present = bool(flags & (1 << 11))
-
-        if pedal_power_balance_present:
-            if cursor + 1 > len(payload):
-                return power, None
-            cursor += 1
-
-        if accumulated_torque_present:
-            if cursor + 2 > len(payload):
-                return power, None
-            cursor += 2
-
-        if wheel_revolution_data_present:
-            if cursor + 6 > len(payload):
-                return power, None
-            cursor += 6
+        power, crank_revs, crank_event_time = _decode_cycling_power_measurement(payload)
+        if crank_revs is None or crank_event_time is None:
+            return power, None
 
         cadence: Optional[float] = None
-        if crank_revolution_data_present:
-            if cursor + 4 > len(payload):
-                return power, None
-
-            crank_revs = struct.unpack_from("<H", payload, cursor)[0]
-            crank_event_time = struct.unpack_from("<H", payload, cursor + 2)[0]
-            cursor += 4
-
-            if (
-                self._last_crank_revs is not None
-                and self._last_crank_event_time is not None
-            ):
-                delta_revs = (crank_revs - self._last_crank_revs) & 0xFFFF
-                delta_time_ticks = (
-                    crank_event_time - self._last_crank_event_time
-                ) & 0xFFFF
-                if delta_time_ticks > 0:
-                    cadence = (delta_revs * 60.0 * 1024.0) / delta_time_ticks
-                elif delta_revs == 0 and power == 0:
-                    # Some trainers repeat identical crank samples while stopped.
-                    cadence = 0.0
-
-            self._last_crank_revs = crank_revs
-            self._last_crank_event_time = crank_event_time
-
-        if extreme_force_magnitudes_present:
-            if cursor + 4 > len(payload):
-                return power, cadence
-            cursor += 4
-
-        if extreme_torque_magnitudes_present:
-            if cursor + 4 > len(payload):
-                return power, cadence
-            cursor += 4
-
-        if extreme_angles_present:
-            if cursor + 3 > len(payload):
-                return power, cadence
-            cursor += 3
-
-        if top_dead_spot_angle_present:
-            if cursor + 2 > len(payload):
-                return power, cadence
-            cursor += 2
-
-        if bottom_dead_spot_angle_present:
-            if cursor + 2 > len(payload):
-                return power, cadence
-            cursor += 2
-
-        if accumulated_energy_present:
-            if cursor + 2 > len(payload):
-                return power, cadence
-            cursor += 2
-
+        if self._last_crank_revs is not None and self._last_crank_event_time is not None:
+            delta_revs = (crank_revs - self._last_crank_revs) & 0xFFFF
+            delta_time_ticks = (crank_event_time - self._last_crank_event_time) & 0xFFFF
+            if delta_time_ticks > 0:
+                cadence = (delta_revs * _CRANK_TICKS_PER_MINUTE) / delta_time_ticks
+            elif delta_revs == 0 and power == 0:
+                # Some trainers repeat identical crank samples while stopped.
+                cadence = 0.0
+
+        self._last_crank_revs = crank_revs
+        self._last_crank_event_time = crank_event_time
         return power, cadence
 
-    async def _simulation_loop(self) -> None:
-        while self._sim_connected:
-            self._sim_tick += 1
-            if self._sim_mode_remaining <= 0:
-                roll = self._sim_rng.random()
-                if roll < 0.12:
-                    self._sim_mode = "surge"
-                    self._sim_mode_remaining = self._sim_rng.randint(8, 20)
-                elif roll < 0.24:
-                    self._sim_mode = "recovery"
-                    self._sim_mode_remaining = self._sim_rng.randint(8, 18)
-                else:
-                    self._sim_mode = "steady"
-                    self._sim_mode_remaining = self._sim_rng.randint(18, 45)
-            self._sim_mode_remaining -= 1
-
+    def _refill_sim_noise(self) -> None:
+        # Per-tick (power, cadence, speed) noise drawn in blocks rather than per tick.
+        rand = self._sim_rng.random
+        self._sim_noise = [
+            (-6.0 + 12.0 * rand(), -8.0 + 16.0 * rand(), -2.2 + 4.4 * rand())
+            for _ in range(_SIM_NOISE_BLOCK_TICKS)
+        ]
+        self._sim_noise_index = 0
+
+    def _simulate_tick(self) -> IndoorBikeData:
+        """Advance the simulator by one tick and return its sample."""
+        # Hot callables and the oscillator state live in locals for the tick.
+        rand = self._sim_rng.random
+        (rot0_sin, rot0_cos), (rot1_sin, rot1_cos), (rot2_sin, rot2_cos), (rot3_sin, rot3_cos) = (
+            _SIM_WAVE_ROTATIONS
+        )
+        (sin0, cos0), (sin1, cos1), (sin2, cos2), (sin3, cos3) = self._sim_waves
+        sin0, cos0 = sin0 * rot0_cos + cos0 * rot0_sin, cos0 * rot0_cos - sin0 * rot0_sin
+        sin1, cos1 = sin1 * rot1_cos + cos1 * rot1_sin, cos1 * rot1_cos - sin1 * rot1_sin
+        sin2, cos2 = sin2 * rot2_cos + cos2 * rot2_sin, cos2 * rot2_cos - sin2 * rot2_sin
+        sin3, cos3 = sin3 * rot3_cos + cos3 * rot3_sin, cos3 * rot3_cos - sin3 * rot3_sin
+        self._sim_waves = [(sin0, cos0), (sin1, cos1), (sin2, cos2), (sin3, cos3)]
+
+        mode_remaining = self._sim_mode_remaining
+        offsets = self._sim_mode_offsets
+        if mode_remaining <= 0:
+            roll = rand()
+            if roll < 0.12:
+                mode = "surge"
+                mode_remaining = 8 + int(rand() * 13)
+            elif roll < 0.24:
+                mode = "recovery"
+                mode_remaining = 8 + int(rand() * 11)
+            else:
+                mode = "steady"
+                mode_remaining = 18 + int(rand() * 28)
+            offsets = _SIM_MODE_OFFSETS.get(mode)
+            self._sim_mode = mode
+            self._sim_mode_offsets = offsets
+        self._sim_mode_remaining = mode_remaining - 1
+
+        if offsets is None:
             mode_offset = 0.0
             cadence_mode_offset = 0.0
-            if self._sim_mode == "surge":
-                mode_offset = self._sim_rng.uniform(20.0, 55.0)
-                cadence_mode_offset = self._sim_rng.uniform(4.0, 11.0)
-            elif self._sim_mode == "recovery":
-                mode_offset = -self._sim_rng.uniform(15.0, 40.0)
-                cadence_mode_offset = -self._sim_rng.uniform(5.0, 12.0)
-
-            periodic = 10.0 * math.sin(self._sim_tick / 5.0) + 6.0 * math.sin(
-                self._sim_tick / 11.0
-            )
-            noise = self._sim_rng.uniform(-6.0, 6.0)
-            dynamic_target = max(
-                50.0, min(1200.0, float(self._sim_target_watts) + mode_offset + periodic + noise)
-            )
+        else:
+            base, span, cadence_base, cadence_span = offsets
+            mode_offset = base + span * rand()
+            cadence_mode_offset = cadence_base + cadence_span * rand()
+
+        noise_index = self._sim_noise_index
+        if noise_index >= len(self._sim_noise):
+            self._refill_sim_noise()
+            noise_index = 0
+        noise = self._sim_noise[noise_index]
+        self._sim_noise_index = noise_index + 1
+
+        power, cadence, speed = _sim_step(
+            self._sim_power,
+            self._sim_cadence,
+            self._sim_speed,
+            self._sim_target_watts,
+            mode_offset,
+            cadence_mode_offset,
+            10.0 * sin0 + 6.0 * sin1,
+            8.0 * sin2 + 5.0 * sin3,
+            noise,
+        )
+        self._sim_power = power
+        self._sim_cadence = cadence
+        self._sim_speed = speed
+        # Positional construction; samples stay immutable because consumers
+        # (merged publish, UI history) keep references to them.
+        # round(x * 10) / 10 avoids the slower decimal path of round(x, 1).
+        return IndoorBikeData(
+            round(power), round(cadence * 10.0) / 10.0, round(speed * 10.0) / 10.0
+        )
 
-            delta = dynamic_target - self._sim_power
-            step = max(-30.0, min(30.0, delta * 0.30))
-            self._sim_power += step
-            if abs(self._sim_power - dynamic_target) < 1.0:
-                self._sim_power = float(dynamic_target)
+    def _simulate_ticks(self, count: int) -> list[IndoorBikeData]:
+        """Advance the simulator by ``count`` ticks at once and return the samples.
 
-            cadence_periodic = 8.0 * math.sin(self._sim_tick / 3.8) + 5.0 * math.sin(
-                self._sim_tick / 8.5
-            )
-            cadence_target = (
-                70.0
-                + (self._sim_power / 8.8)
-                + cadence_mode_offset
-                + cadence_periodic
-                + self._sim_rng.uniform(-8.0, 8.0)
-            )
-            speed_target = 14.0 + (self._sim_power / 11.0) + self._sim_rng.uniform(-2.2, 2.2)
-            self._sim_cadence += max(
-                -5.5, min(5.5, (cadence_target - self._sim_cadence) * 0.55)
-            )
-            self._sim_speed += max(-2.8, min(2.8, (speed_target - self._sim_speed) * 0.40))
-
-            self._sim_cadence = max(45.0, min(128.0, self._sim_cadence))
-            self._sim_speed = max(7.0, min(78.0, self._sim_speed))
-            metrics = IndoorBikeData(
-                instantaneous_power=int(round(self._sim_power)),
-                instantaneous_cadence=round(self._sim_cadence, 1),
-                instantaneous_speed_kmh=round(self._sim_speed, 1),
-            )
+        Used for fast-forward/replay; nothing is dispatched and no time passes.
+        """
+        tick = self._simulate_tick
+        return [tick() for _ in range(count)]
 
-            if self._metrics_callback is not None:
-                maybe_coro = self._metrics_callback(metrics)
-                if asyncio.iscoroutine(maybe_coro):
-                    asyncio.create_task(maybe_coro)
+    async def _simulation_loop(self) -> None:
+        while self._sim_connected:
+            metrics = self._simulate_tick()
+            if self._dispatch_metrics is not None:
+                self._dispatch_metrics(metrics)
 
             await asyncio.sleep(1.0)
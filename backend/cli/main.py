@@ -4,9 +4,8 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-
-from backend.ble.ftms_client import FTMSClient
-from backend.core.engine import VeloxEngine
+import importlib
+from typing import Any, Coroutine
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -78,7 +77,20 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _run_event_loop(main: Coroutine[Any, Any, int]) -> int:
+    """Run ``main`` on uvloop when it is installed, else on the default asyncio loop."""
+    uvloop: Any
+    try:
+        uvloop = importlib.import_module("uvloop")
+    except ImportError:  # optional accelerator
+        return asyncio.run(main)
+    result: int = uvloop.run(main)
+    return result
+
+
 async def run_scan(simulate_ht: bool = False) -> int:
+    from backend.ble.ftms_client import FTMSClient
+
     client = FTMSClient(simulate_ht=simulate_ht)
     devices = await client.scan(timeout=5.0)
 
@@ -104,6 +116,8 @@ async def run_connect(
     ble_pair: bool,
     startup_wait: float,
 ) -> int:
+    from backend.core.engine import VeloxEngine
+
     engine = VeloxEngine(
         debug_ftms=debug_ftms,
         simulate_ht=simulate_ht,
@@ -139,7 +153,7 @@ def main() -> int:
         )
 
     if args.scan:
-        return asyncio.run(run_scan(args.debug_sim_ht))
+        return _run_event_loop(run_scan(args.debug_sim_ht))
 
     connect_target = args.connect
     if args.erg is not None and connect_target is None:
@@ -149,7 +163,7 @@ def main() -> int:
         parser.print_help()
         return 1
 
-    return asyncio.run(
+    return _run_event_loop(
         run_connect(
             connect_target,
             args.erg,
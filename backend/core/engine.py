@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+import sys
+import time
 
 from backend.ble.ftms_client import FTMSClient, IndoorBikeData
 from backend.core.state import EngineState
 
+# Minimum delay between two terminal metrics lines.
+_PRINT_INTERVAL_NS = 1_000_000_000
+
 
 class VeloxEngine:
     def __init__(
@@ -26,6 +30,8 @@ class VeloxEngine:
         self.state = EngineState()
         self._stop_event = asyncio.Event()
         self._first_metrics_event = asyncio.Event()
+        self._first_metrics_seen = False
+        self._last_print_ns = -_PRINT_INTERVAL_NS
         self._startup_wait_seconds = startup_wait_seconds
         self._deferred_erg_watts: int | None = None
 
@@ -40,9 +46,8 @@ class VeloxEngine:
             if erg_watts is not None:
                 await self._set_erg_with_startup_wait(erg_watts)
 
-            while not self._stop_event.is_set():
-                self._print_metrics_line()
-                await asyncio.sleep(1)
+            # Metrics lines are printed from _on_metrics as samples arrive.
+            await self._stop_event.wait()
         finally:
             await self._client.disconnect()
 
@@ -50,10 +55,17 @@ class VeloxEngine:
         self._stop_event.set()
 
     async def _on_metrics(self, metrics: IndoorBikeData) -> None:
-        self.state.last_power_watts = metrics.instantaneous_power
-        self.state.last_cadence_rpm = metrics.instantaneous_cadence
-        self.state.last_update = datetime.utcnow()
-        self._first_metrics_event.set()
+        state = self.state
+        state.last_power_watts = metrics.instantaneous_power
+        state.last_cadence_rpm = metrics.instantaneous_cadence
+        state.last_update_ns = time.time_ns()
+        now_ns = time.monotonic_ns()
+        if now_ns - self._last_print_ns >= _PRINT_INTERVAL_NS:
+            self._last_print_ns = now_ns
+            self._print_metrics_line()
+        if not self._first_metrics_seen:
+            self._first_metrics_seen = True
+            self._first_metrics_event.set()
 
         if self._deferred_erg_watts is not None:
             watts = self._deferred_erg_watts
@@ -61,17 +73,12 @@ class VeloxEngine:
             await self._try_set_erg(watts, reason="first trainer signal")
 
     def _print_metrics_line(self) -> None:
-        power = (
-            f"{self.state.last_power_watts} W"
-            if self.state.last_power_watts is not None
-            else "N/A"
-        )
-        cadence = (
-            f"{self.state.last_cadence_rpm:.1f} rpm"
-            if self.state.last_cadence_rpm is not None
-            else "N/A"
+        power = self.state.last_power_watts
+        cadence = self.state.last_cadence_rpm
+        sys.stdout.write(
+            f"Power: {'N/A' if power is None else f'{power} W'} | "
+            f"Cadence: {'N/A' if cadence is None else f'{cadence:.1f} rpm'}\n"
         )
-        print(f"Power: {power} | Cadence: {cadence}")
 
     async def _set_erg_with_startup_wait(self, watts: int) -> None:
         print(
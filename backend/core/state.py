@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(slots=True)
 class EngineState:
     connected_device: str | None = None
     last_power_watts: int | None = None
     last_cadence_rpm: float | None = None
-    last_update: datetime | None = None
+    # time.time_ns() of the last metrics sample, 0 before the first one.
+    last_update_ns: int = 0
+
+    @property
+    def last_update(self) -> datetime | None:
+        if not self.last_update_ns:
+            return None
+        return datetime.fromtimestamp(self.last_update_ns / 1e9, tz=timezone.utc)
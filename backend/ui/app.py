@@ -3,19 +3,23 @@
 from __future__ import annotations
 
 import asyncio
-import threading
+import contextlib
+import os
 import time
 import tkinter as tk
-from concurrent.futures import Future
-from pathlib import Path
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import accumulate
 from tkinter import filedialog, messagebox, ttk
-from typing import Any, Callable, cast
+from typing import Any, Callable, Coroutine, TypeVar, cast
 
 from backend.ble.ftms_client import IndoorBikeData, ScannedDevice
 from backend.ui.controller import UIController
 from backend.workout.library import build_plan_from_template, list_templates
 from backend.workout.model import WorkoutPlan
-from backend.workout.parser import WorkoutParseError, load_workout
+from backend.workout.parser import load_workout
 from backend.workout.runner import TargetMode, WorkoutProgress
 from backend.workout.session_store import (
     SessionRecord,
@@ -25,22 +29,186 @@ from backend.workout.session_store import (
 )
 
 
+_T = TypeVar("_T")
+
+# (m/h) x ns in one km: 1000 m x 3600e9 ns per hour.
+_M_PER_H_NS_PER_KM = 1000 * 3_600_000_000_000
+
+# Power samples in the rolling "30s avg" readout (trainers report at ~1 Hz).
+_RECENT_POWER_SAMPLES = 30
+
+# Minimum spacing between workout progress paints (~60 Hz).
+_PROGRESS_FRAME_NS = 16_000_000
+
+# Slots of VeloxUI._zone_counts.
+_ZONE_POWER_HITS = 0
+_ZONE_POWER_TOTAL = 1
+_ZONE_RPM_HITS = 2
+_ZONE_RPM_TOTAL = 3
+_ZONE_BOTH_HITS = 4
+_ZONE_BOTH_TOTAL = 5
+_ZONE_COUNTERS = 6
+
+
+def _classify_zone(value: float | None, lo: float | None, hi: float | None) -> str:
+    if value is None:
+        return "#475569"
+    if lo is None or hi is None:
+        return "#3b82f6"
+    if lo <= value <= hi:
+        return "#22c55e"
+    span = max(1.0, hi - lo)
+    soft = span * 0.25
+    if (lo - soft) <= value <= (hi + soft):
+        return "#f59e0b"
+    return "#ef4444"
+
+
+@lru_cache(maxsize=1024)
+def _zone_color(value: float | None, lo: float | None, hi: float | None) -> str:
+    # For inputs that repeat: readings quantized by the BLE protocol against
+    # step-constant zones. Zones that move every tick use _classify_zone.
+    return _classify_zone(value, lo, hi)
+
+
+@lru_cache(maxsize=4096)
+def _format_time(seconds: int) -> str:
+    minutes, sec = divmod(max(0, seconds), 60)
+    return f"{minutes:02d}:{sec:02d}"
+
+
+def _avg(total: float, count: int) -> float | None:
+    if count <= 0:
+        return None
+    return total / count
+
+
+def _pct(hits: int, total: int) -> float | None:
+    if total <= 0:
+        return None
+    return (hits * 100.0) / total
+
+
+@dataclass(slots=True)
+class _MetricTotals:
+    """Session running sums; averages divide by every sample, missing fields included."""
+
+    sample_count: int = 0
+    power_watts: float = 0.0
+    cadence_rpm: float = 0.0
+    speed_kmh: float = 0.0
+
+    def add(self, metrics: IndoorBikeData) -> None:
+        power, cadence, speed = metrics
+        if power is not None:
+            self.power_watts += power
+        if cadence is not None:
+            self.cadence_rpm += cadence
+        if speed is not None:
+            self.speed_kmh += speed
+        self.sample_count += 1
+
+
+@lru_cache(maxsize=64)
+def _gauge_fonts(
+    radius: int,
+) -> tuple[tuple[str, int, str], tuple[str, int, str], tuple[str, int]]:
+    """Title, value and range fonts for a gauge of the given radius."""
+    return (
+        ("DejaVu Sans", max(9, min(12, int(radius * 0.16))), "bold"),
+        ("DejaVu Sans", max(12, min(20, int(radius * 0.28))), "bold"),
+        ("DejaVu Sans", max(8, min(10, int(radius * 0.12)))),
+    )
+
+
+def _history_row(item: SessionRecord) -> str:
+    date = item.ended_at_utc.split("T")[0]
+    status = "OK" if item.completed else "STOP"
+    mins = item.elapsed_duration_sec // 60
+    return f"{date} | {status} | {item.workout_name} | {mins}min"
+
+
+def _device_row(device: ScannedDevice) -> str:
+    mark = "FTMS" if device.has_ftms else "-"
+    manufacturer = f" | {device.manufacturer}" if device.manufacturer else ""
+    return f"{device.name}{manufacturer} | {device.address} | RSSI={device.rssi} [{mark}]"
+
+
+class _RollingMean:
+    """Mean of the last ``size`` values with O(1) push."""
+
+    __slots__ = ("_values", "_total")
+
+    def __init__(self, size: int) -> None:
+        self._values: deque[float] = deque(maxlen=size)
+        self._total = 0.0
+
+    def push(self, value: float) -> None:
+        values = self._values
+        if len(values) == values.maxlen:
+            self._total -= values[0]
+        values.append(value)
+        self._total += value
+
+    @property
+    def mean(self) -> float | None:
+        if not self._values:
+            return None
+        return self._total / len(self._values)
+
+
 class AsyncBridge:
-    def __init__(self) -> None:
-        self._loop = asyncio.new_event_loop()
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+    """Asyncio loop driven from the Tk event loop, on the Tk thread.
 
-    def _run(self) -> None:
-        asyncio.set_event_loop(self._loop)
-        self._loop.run_forever()
+    Every tick runs a fixed ``_PASSES_PER_TICK`` loop iterations, so short
+    chains of ready callbacks finish in one tick while a self-rescheduling
+    callback still cannot starve Tk. Coroutines and their done callbacks
+    never cross a thread boundary.
+    """
 
-    def submit(self, coro: Any) -> Future[Any]:
-        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    # About 80 us per tick on an idle loop.
+    _PASSES_PER_TICK = 16
 
-    def shutdown(self) -> None:
-        self._loop.call_soon_threadsafe(self._loop.stop)
-        self._thread.join(timeout=2.0)
+    def __init__(self, root: tk.Misc, interval_ms: int = 10) -> None:
+        self._root = root
+        self._interval_ms = interval_ms
+        self._loop = asyncio.new_event_loop()
+        self._after_id: str | None = root.after(interval_ms, self._tick)
+
+    def _tick(self) -> None:
+        # A modal dialog opened from a loop callback pumps Tk events itself;
+        # skip the nested tick instead of re-entering the running loop.
+        if not self._loop.is_running():
+            # One run_forever() pass runs only the callbacks that were ready
+            # when it started; later passes pick up what it queued, e.g. a task
+            # resuming after sleep(0) or a future's done callbacks. The loop
+            # exposes no public ready count, so the pass count is fixed.
+            for _ in range(self._PASSES_PER_TICK):
+                self._loop.call_soon(self._loop.stop)
+                self._loop.run_forever()
+        self._after_id = self._root.after(self._interval_ms, self._tick)
+
+    def submit(self, coro: Coroutine[Any, Any, _T]) -> asyncio.Task[_T]:
+        return self._loop.create_task(coro)
+
+    def submit_blocking(self, fn: Callable[..., _T], *args: Any) -> asyncio.Task[_T]:
+        """Run ``fn(*args)`` on a worker thread; the task completes on the Tk thread."""
+        return self.submit(asyncio.to_thread(fn, *args))
+
+    def shutdown(self, final: Coroutine[Any, Any, Any] | None = None) -> None:
+        """Stop ticking, give ``final`` up to 2 s to finish, then cancel the rest."""
+        if self._after_id is not None:
+            self._root.after_cancel(self._after_id)
+            self._after_id = None
+        if final is not None:
+            with contextlib.suppress(Exception):
+                self._loop.run_until_complete(asyncio.wait_for(final, timeout=2.0))
+        pending = asyncio.all_tasks(self._loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self._loop.close()
 
 
 class VeloxUI:
@@ -54,7 +222,7 @@ class VeloxUI:
         self.root.title("Velox Engine")
         self.root.geometry("1240x860")
 
-        self.bridge = AsyncBridge()
+        self.bridge = AsyncBridge(root)
         self.controller = UIController(
             debug_ftms=False,
             simulate_ht=simulate_ht,
@@ -70,31 +238,73 @@ class VeloxUI:
         self.current_power_w: int | None = None
         self.current_cadence_rpm: float | None = None
         self.current_speed_kmh: float | None = None
-        self.distance_km = 0.0
-        self._last_metric_ts: float | None = None
+        # Exact integer sum of speed (m/h) x elapsed time (ns); see distance_km.
+        self._distance_m_per_h_ns = 0
+        self._last_metric_ns: int | None = None
         self._estimated_total_distance_km = 0.0
         self._session_started_utc: str | None = None
         self._session_mode: TargetMode = "erg"
         self._session_ftp_watts = 220
-        self._metric_sample_count = 0
-        self._sum_power_watts = 0.0
-        self._sum_cadence_rpm = 0.0
-        self._sum_speed_kmh = 0.0
-        self._zone_power_hits = 0
-        self._zone_power_total = 0
-        self._zone_rpm_hits = 0
-        self._zone_rpm_total = 0
-        self._zone_both_hits = 0
-        self._zone_both_total = 0
-
-        self._template_values = [
-            f"{template.category} - {template.name} [{template.key}]"
-            for template in list_templates()
-        ]
-        self._template_by_label = {
-            f"{template.category} - {template.name} [{template.key}]": template.key
-            for template in list_templates()
-        }
+        self._metric_totals = _MetricTotals()
+        self._recent_power = _RollingMean(_RECENT_POWER_SAMPLES)
+        # Zone hit/total counters, indexed by the _ZONE_* constants.
+        self._zone_counts = array("q", bytes(8 * _ZONE_COUNTERS))
+        # Metric samples only mark the gauges dirty; one redraw per interval
+        # draws the latest values, so bursts of samples cost a single redraw.
+        self._redraw_interval_ms = 60
+        self._redraw_pending = False
+        self._pending_ui_ops: list[Callable[[], None]] = []
+        # Bumped on every workout change; a background load applies its result
+        # only if no newer load or workout choice happened meanwhile.
+        self._workout_load_seq = 0
+        self._pending_progress: WorkoutProgress | None = None
+        self._progress_paint_scheduled = False
+        self._last_progress_paint_ns = 0
+        # Last text written through _set_text, keyed by Tcl variable name.
+        self._var_texts: dict[str, str] = {}
+        self._widget_states: dict[str, str] = {}
+        # Canvas items and last drawn (width, height) per gauge, keyed by widget path.
+        self._gauge_items: dict[str, dict[str, int]] = {}
+        self._gauge_sizes: dict[str, tuple[int, int]] = {}
+        # Inputs of the last drawn frame per gauge; an identical frame is skipped.
+        self._gauge_signatures: dict[str, tuple[object, ...]] = {}
+        # Latest <Configure> size per canvas, keyed by widget path.
+        self._canvas_sizes: dict[str, tuple[int, int]] = {}
+        self._resize_after_id: str | None = None
+        # Workout chart scene: plan and size it was built for, step bar boxes,
+        # active-step overlay and elapsed cursor items, the step currently
+        # highlighted and the cursor's drawn x (None while hidden).
+        self._curve_plan: WorkoutPlan | None = None
+        # Per-plan chart data from _prepare_curve_geometry: step start/end
+        # seconds as a prefix sum (0 first, total last) and the y-axis maximum.
+        self._curve_geometry_plan: WorkoutPlan | None = None
+        self._curve_prefix_sec: list[int] = [0]
+        self._curve_max_watts = 100
+        self._curve_size = (0, 0)
+        self._curve_bar_boxes: list[tuple[int, int, int, int]] = []
+        self._curve_active_item: int | None = None
+        self._curve_cursor_item: int | None = None
+        self._curve_active_step: int | None = None
+        self._curve_cursor_x: int | None = None
+        # Rows currently in the steps listbox and the 1-based step selected in
+        # it (0 when none), so reloads and progress ticks only touch what changed.
+        self._step_rows: list[str] = []
+        self._selected_step = 0
+        # Step-constant progress fields behind the step/target/RPM labels as
+        # last painted; they only change on a step boundary.
+        self._painted_step_fields: tuple[object, ...] | None = None
+
+        self._templates = list_templates()
+        self._template_values: list[str] = []
+        self._template_by_label: dict[str, str] = {}
+        self._template_duration_by_label: dict[str, int] = {}
+        for template in self._templates:
+            label = f"{template.category} - {template.name} [{template.key}]"
+            self._template_values.append(label)
+            self._template_by_label[label] = template.key
+            self._template_duration_by_label[label] = sum(
+                step.duration_sec for step in template.steps
+            )
         self._duration_band_values = [
             "All",
             "<=30 min",
@@ -102,11 +312,26 @@ class VeloxUI:
             "45-60 min",
             ">=60 min",
         ]
+        # Templates are static, so each band's label list is computed once; an
+        # empty band falls back to every template.
+        self._template_values_by_band = {
+            band: [
+                label
+                for label, duration_sec in self._template_duration_by_label.items()
+                if self._filter_match(duration_sec, band)
+            ]
+            or self._template_values[:]
+            for band in self._duration_band_values
+        }
 
         self._build_widgets()
         self._bind_responsive_redraw()
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
+    @property
+    def distance_km(self) -> float:
+        return self._distance_m_per_h_ns / _M_PER_H_NS_PER_KM
+
     def _build_widgets(self) -> None:
         top = ttk.Frame(self.root, padding=12)
         top.pack(fill=tk.X)
@@ -310,7 +535,16 @@ class VeloxUI:
         self.gauge_rpm.bind("<Configure>", self._on_canvas_resize)
         self.gauge_distance.bind("<Configure>", self._on_canvas_resize)
 
-    def _on_canvas_resize(self, _event: tk.Event[tk.Misc]) -> None:
+    def _on_canvas_resize(self, event: tk.Event[tk.Misc]) -> None:
+        self._canvas_sizes[str(event.widget)] = (event.width, event.height)
+        # A window drag emits a <Configure> per intermediate size; redraw once
+        # the size has been stable for a short while.
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(80, self._redraw_after_resize)
+
+    def _redraw_after_resize(self) -> None:
+        self._resize_after_id = None
         if self.workout is not None:
             active_step = None
             elapsed_total = 0
@@ -324,22 +558,51 @@ class VeloxUI:
             )
         self._refresh_gauges()
 
-    def _call_ui(self, fn: Callable[[], None]) -> None:
-        self.root.after(0, fn)
-
-    def _format_time(self, seconds: int) -> str:
-        minutes, sec = divmod(max(0, seconds), 60)
-        return f"{minutes:02d}:{sec:02d}"
+    def _canvas_size(self, canvas: tk.Canvas) -> tuple[int, int]:
+        # Kept current by <Configure>; the requested size covers draws before
+        # the first one and is cached so they do not query Tk either.
+        key = str(canvas)
+        size = self._canvas_sizes.get(key)
+        if size is None:
+            size = (canvas.winfo_reqwidth(), canvas.winfo_reqheight())
+            self._canvas_sizes[key] = size
+        return size
+
+    def _set_text(self, var: tk.StringVar, text: str) -> None:
+        # Skips set() (trace callbacks, label relayout) when the text is unchanged;
+        # vars routed here must not be set any other way.
+        key = str(var)
+        if self._var_texts.get(key) != text:
+            self._var_texts[key] = text
+            var.set(text)
+
+    def _set_state(self, widget: ttk.Button, state: str) -> None:
+        # Same idea as _set_text for widget state; an unseen widget is always
+        # configured once, whatever state it was created with.
+        key = str(widget)
+        if self._widget_states.get(key) != state:
+            self._widget_states[key] = state
+            widget.config(state=state)
 
-    def _avg(self, total: float, count: int) -> float | None:
-        if count <= 0:
-            return None
-        return total / count
+    def _call_ui(self, fn: Callable[[], None]) -> None:
+        # Deferred UI work queued in the same loop step runs from one after() call.
+        self._pending_ui_ops.append(fn)
+        if len(self._pending_ui_ops) == 1:
+            self.root.after(0, self._flush_ui_ops)
+
+    def _flush_ui_ops(self) -> None:
+        ops = self._pending_ui_ops
+        self._pending_ui_ops = []
+        for fn in ops:
+            # Each op used to get its own after() callback; keep a failure from
+            # dropping the rest of the batch and report it the way Tk would.
+            try:
+                fn()
+            except Exception as exc:
+                self.root.report_callback_exception(type(exc), exc, exc.__traceback__)
 
     def _template_duration_sec(self, template_label: str) -> int:
-        key = self._template_by_label[template_label]
-        template = next(item for item in list_templates() if item.key == key)
-        return sum(step.duration_sec for step in template.steps)
+        return self._template_duration_by_label[template_label]
 
     def _filter_match(self, duration_sec: int, band: str) -> bool:
         minutes = duration_sec / 60.0
@@ -358,13 +621,7 @@ class VeloxUI:
 
     def _apply_duration_filter(self) -> None:
         band = self.duration_band_var.get() if hasattr(self, "duration_band_var") else "All"
-        filtered = [
-            label
-            for label in self._template_values
-            if self._filter_match(self._template_duration_sec(label), band)
-        ]
-        if not filtered:
-            filtered = self._template_values[:]
+        filtered = self._template_values_by_band.get(band, self._template_values)
         self.template_combo.configure(values=filtered)
         if self.template_var.get() not in filtered:
             self.template_var.set(filtered[0])
@@ -377,27 +634,7 @@ class VeloxUI:
         if not sessions:
             self.history_list.insert(tk.END, "No saved sessions yet")
             return
-        for item in sessions:
-            date = item.ended_at_utc.split("T")[0]
-            status = "OK" if item.completed else "STOP"
-            mins = item.elapsed_duration_sec // 60
-            self.history_list.insert(
-                tk.END,
-                f"{date} | {status} | {item.workout_name} | {mins}min",
-            )
-
-    def _zone_color(self, value: float | None, lo: float | None, hi: float | None) -> str:
-        if value is None:
-            return "#475569"
-        if lo is None or hi is None:
-            return "#3b82f6"
-        if lo <= value <= hi:
-            return "#22c55e"
-        span = max(1.0, hi - lo)
-        soft = span * 0.25
-        if (lo - soft) <= value <= (hi + soft):
-            return "#f59e0b"
-        return "#ef4444"
+        self.history_list.insert(tk.END, *(_history_row(item) for item in sessions))
 
     def _draw_gauge(
         self,
@@ -412,11 +649,14 @@ class VeloxUI:
         expected_lo: float | None = None,
         expected_hi: float | None = None,
     ) -> None:
-        canvas.update_idletasks()
-        w = max(180, int(canvas.winfo_width()))
-        h = max(140, int(canvas.winfo_height()))
-        canvas.delete("all")
-        canvas.create_rectangle(0, 0, w, h, fill="#0b1220", outline="")
+        width, height = self._canvas_size(canvas)
+        w = max(180, width)
+        h = max(140, height)
+        key = str(canvas)
+        signature = (w, h, title, value, minimum, maximum, unit, color, expected_lo, expected_hi)
+        if self._gauge_signatures.get(key) == signature:
+            return
+        self._gauge_signatures[key] = signature
 
         cx = w // 2
         cy = int(h * 0.75)
@@ -426,68 +666,75 @@ class VeloxUI:
 
         start = 135
         span = 270
-        canvas.create_arc(
-            box,
-            start=start,
-            extent=span,
-            style=tk.ARC,
-            width=16,
-            outline="#1f2937",
-        )
-
+        # Gauge items are created once per canvas and then updated in place.
+        items = self._gauge_items.get(key)
+        if items is None:
+            items = {
+                "background": canvas.create_rectangle(0, 0, w, h, fill="#0b1220", outline=""),
+                "track": canvas.create_arc(
+                    box,
+                    start=start,
+                    extent=span,
+                    style=tk.ARC,
+                    width=16,
+                    outline="#1f2937",
+                ),
+                "zone": canvas.create_arc(
+                    box, style=tk.ARC, width=16, outline="#14532d", state=tk.HIDDEN
+                ),
+                "value_arc": canvas.create_arc(box, style=tk.ARC, width=16, state=tk.HIDDEN),
+                "title": canvas.create_text(cx, 20, fill="#cbd5e1"),
+                "value": canvas.create_text(cx, cy - 14, fill="#e2e8f0"),
+                "range": canvas.create_text(cx, cy + 10, fill="#64748b"),
+            }
+            self._gauge_items[key] = items
+
+        if self._gauge_sizes.get(key) != (w, h):
+            self._gauge_sizes[key] = (w, h)
+            canvas.coords(items["background"], 0, 0, w, h)
+            for name in ("track", "zone", "value_arc"):
+                canvas.coords(items[name], *box)
+            canvas.coords(items["title"], cx, 20)
+            canvas.coords(items["value"], cx, cy - 14)
+            canvas.coords(items["range"], cx, cy + 10)
+            title_font, value_font, sub_font = _gauge_fonts(radius)
+            canvas.itemconfigure(items["title"], font=title_font)
+            canvas.itemconfigure(items["value"], font=value_font)
+            canvas.itemconfigure(items["range"], font=sub_font)
+
+        zone_shown = False
         if expected_lo is not None and expected_hi is not None:
             norm_lo = max(0.0, min(1.0, (expected_lo - minimum) / (maximum - minimum)))
             norm_hi = max(0.0, min(1.0, (expected_hi - minimum) / (maximum - minimum)))
             if norm_hi > norm_lo:
-                canvas.create_arc(
-                    box,
+                zone_shown = True
+                canvas.itemconfigure(
+                    items["zone"],
                     start=start + (1.0 - norm_hi) * span,
                     extent=(norm_hi - norm_lo) * span,
-                    style=tk.ARC,
-                    width=16,
-                    outline="#14532d",
+                    state=tk.NORMAL,
                 )
+        if not zone_shown:
+            canvas.itemconfigure(items["zone"], state=tk.HIDDEN)
 
         if value is not None:
             clamped = max(minimum, min(maximum, value))
             norm = (clamped - minimum) / (maximum - minimum)
-            canvas.create_arc(
-                box,
+            canvas.itemconfigure(
+                items["value_arc"],
                 start=start + (1.0 - norm) * span,
                 extent=norm * span,
-                style=tk.ARC,
-                width=16,
                 outline=color,
+                state=tk.NORMAL,
             )
-
-        title_size = max(9, min(12, int(radius * 0.16)))
-        value_size = max(12, min(20, int(radius * 0.28)))
-        sub_size = max(8, min(10, int(radius * 0.12)))
-        canvas.create_text(
-            cx,
-            20,
-            text=title,
-            fill="#cbd5e1",
-            font=("DejaVu Sans", title_size, "bold"),
-        )
-        if value is None:
-            value_text = "--"
-        else:
             value_text = f"{value:.1f}{unit}"
-        canvas.create_text(
-            cx,
-            cy - 14,
-            text=value_text,
-            fill="#e2e8f0",
-            font=("DejaVu Sans", value_size, "bold"),
-        )
-        canvas.create_text(
-            cx,
-            cy + 10,
-            text=f"{minimum:.0f}..{maximum:.0f}{unit}",
-            fill="#64748b",
-            font=("DejaVu Sans", sub_size),
-        )
+        else:
+            canvas.itemconfigure(items["value_arc"], state=tk.HIDDEN)
+            value_text = "--"
+
+        canvas.itemconfigure(items["title"], text=title)
+        canvas.itemconfigure(items["value"], text=value_text)
+        canvas.itemconfigure(items["range"], text=f"{minimum:.0f}..{maximum:.0f}{unit}")
 
     def _refresh_gauges(self) -> None:
         p_lo = p_hi = c_lo = c_hi = None
@@ -507,17 +754,17 @@ class VeloxUI:
         if self.current_progress is not None:
             speed_expected = max(8.0, min(60.0, 16.0 + (self.current_progress.target_watts / 12.0)))
 
-        power_color = self._zone_color(
+        power_color = _zone_color(
             None if self.current_power_w is None else float(self.current_power_w),
             None if p_lo is None else float(p_lo),
             None if p_hi is None else float(p_hi),
         )
-        rpm_color = self._zone_color(
+        rpm_color = _zone_color(
             self.current_cadence_rpm,
             None if c_lo is None else float(c_lo),
             None if c_hi is None else float(c_hi),
         )
-        speed_color = self._zone_color(
+        speed_color = _zone_color(
             self.current_speed_kmh,
             None if speed_expected is None else speed_expected - 4.0,
             None if speed_expected is None else speed_expected + 4.0,
@@ -526,7 +773,7 @@ class VeloxUI:
         distance_expected = None
         if elapsed_ratio is not None and self._estimated_total_distance_km > 0:
             distance_expected = self._estimated_total_distance_km * elapsed_ratio
-        distance_color = self._zone_color(
+        distance_color = _classify_zone(
             self.distance_km,
             None if distance_expected is None else distance_expected * 0.8,
             None if distance_expected is None else distance_expected * 1.2,
@@ -585,89 +832,68 @@ class VeloxUI:
         if speed_expected is not None:
             zone_parts.append(f"Speed {speed_expected - 4:.0f}-{speed_expected + 4:.0f}km/h")
         if zone_parts:
-            self.zone_var.set("Zones: " + " | ".join(zone_parts))
+            self._set_text(self.zone_var, "Zones: " + " | ".join(zone_parts))
         else:
-            self.zone_var.set("Zones: -")
+            self._set_text(self.zone_var, "Zones: -")
 
-        self.compliance_var.set(self._format_zone_compliance())
+        self._set_text(self.compliance_var, self._format_zone_compliance())
 
     def _format_zone_compliance(self) -> str:
-        power = self._pct(self._zone_power_hits, self._zone_power_total)
-        rpm = self._pct(self._zone_rpm_hits, self._zone_rpm_total)
-        both = self._pct(self._zone_both_hits, self._zone_both_total)
+        power_hits, power_total, rpm_hits, rpm_total, both_hits, both_total = self._zone_counts
+        power = _pct(power_hits, power_total)
+        rpm = _pct(rpm_hits, rpm_total)
+        both = _pct(both_hits, both_total)
         if power is None and rpm is None and both is None:
             return "Zone compliance: -"
 
         parts: list[str] = []
         if power is not None:
             parts.append(
-                f"Power {power:.0f}% ({self._zone_power_hits}/{self._zone_power_total})"
+                f"Power {power:.0f}% ({power_hits}/{power_total})"
             )
         if rpm is not None:
-            parts.append(f"RPM {rpm:.0f}% ({self._zone_rpm_hits}/{self._zone_rpm_total})")
+            parts.append(f"RPM {rpm:.0f}% ({rpm_hits}/{rpm_total})")
         if both is not None:
-            parts.append(f"Both {both:.0f}% ({self._zone_both_hits}/{self._zone_both_total})")
+            parts.append(f"Both {both:.0f}% ({both_hits}/{both_total})")
         return "Zone compliance: " + " | ".join(parts)
 
-    def _pct(self, hits: int, total: int) -> float | None:
-        if total <= 0:
-            return None
-        return (hits * 100.0) / total
-
     def _reset_zone_compliance(self) -> None:
-        self._zone_power_hits = 0
-        self._zone_power_total = 0
-        self._zone_rpm_hits = 0
-        self._zone_rpm_total = 0
-        self._zone_both_hits = 0
-        self._zone_both_total = 0
+        self._zone_counts = array("q", bytes(8 * _ZONE_COUNTERS))
 
     def _update_zone_compliance(self) -> None:
         progress = self.current_progress
         if progress is None:
             return
 
+        counts = self._zone_counts
+        power = self.current_power_w
+        power_lo = progress.expected_power_min_watts
+        power_hi = progress.expected_power_max_watts
         power_ok: bool | None = None
-        if (
-            self.current_power_w is not None
-            and progress.expected_power_min_watts is not None
-            and progress.expected_power_max_watts is not None
-        ):
-            self._zone_power_total += 1
-            power_ok = (
-                progress.expected_power_min_watts
-                <= self.current_power_w
-                <= progress.expected_power_max_watts
-            )
-            if power_ok:
-                self._zone_power_hits += 1
-
+        if power is not None and power_lo is not None and power_hi is not None:
+            power_ok = power_lo <= power <= power_hi
+            counts[_ZONE_POWER_TOTAL] += 1
+            counts[_ZONE_POWER_HITS] += power_ok
+
+        cadence = self.current_cadence_rpm
+        cadence_lo = progress.expected_cadence_min_rpm
+        cadence_hi = progress.expected_cadence_max_rpm
         rpm_ok: bool | None = None
-        if (
-            self.current_cadence_rpm is not None
-            and progress.expected_cadence_min_rpm is not None
-            and progress.expected_cadence_max_rpm is not None
-        ):
-            self._zone_rpm_total += 1
-            rpm_ok = (
-                progress.expected_cadence_min_rpm
-                <= self.current_cadence_rpm
-                <= progress.expected_cadence_max_rpm
-            )
-            if rpm_ok:
-                self._zone_rpm_hits += 1
+        if cadence is not None and cadence_lo is not None and cadence_hi is not None:
+            rpm_ok = cadence_lo <= cadence <= cadence_hi
+            counts[_ZONE_RPM_TOTAL] += 1
+            counts[_ZONE_RPM_HITS] += rpm_ok
 
         if power_ok is not None and rpm_ok is not None:
-            self._zone_both_total += 1
-            if power_ok and rpm_ok:
-                self._zone_both_hits += 1
+            counts[_ZONE_BOTH_TOTAL] += 1
+            counts[_ZONE_BOTH_HITS] += power_ok and rpm_ok
 
     def on_scan(self) -> None:
         self.status_var.set("Scanning BLE...")
         future = self.bridge.submit(self.controller.scan())
         future.add_done_callback(self._on_scan_done)
 
-    def _on_scan_done(self, future: Future[list[ScannedDevice]]) -> None:
+    def _on_scan_done(self, future: asyncio.Future[list[ScannedDevice]]) -> None:
         def update() -> None:
             try:
                 self.devices = future.result()
@@ -677,13 +903,8 @@ class VeloxUI:
                 return
 
             self.device_list.delete(0, tk.END)
-            for device in self.devices:
-                mark = "FTMS" if device.has_ftms else "-"
-                manufacturer = f" | {device.manufacturer}" if device.manufacturer else ""
-                self.device_list.insert(
-                    tk.END,
-                    f"{device.name}{manufacturer} | {device.address} | RSSI={device.rssi} [{mark}]",
-                )
+            if self.devices:
+                self.device_list.insert(tk.END, *(_device_row(device) for device in self.devices))
             self.status_var.set(f"Scan done: {len(self.devices)} devices")
 
         self._call_ui(update)
@@ -709,7 +930,7 @@ class VeloxUI:
         )
         future.add_done_callback(self._on_connect_done)
 
-    def _on_connect_done(self, future: Future[str]) -> None:
+    def _on_connect_done(self, future: asyncio.Future[str]) -> None:
         def update() -> None:
             try:
                 label = future.result()
@@ -720,8 +941,8 @@ class VeloxUI:
 
             self.connected = True
             self.status_var.set(f"Connected: {label}")
-            self.connect_btn.config(state=tk.DISABLED)
-            self.disconnect_btn.config(state=tk.NORMAL)
+            self._set_state(self.connect_btn, tk.DISABLED)
+            self._set_state(self.disconnect_btn, tk.NORMAL)
             self._refresh_workout_buttons()
 
         self._call_ui(update)
@@ -730,7 +951,7 @@ class VeloxUI:
         future = self.bridge.submit(self.controller.disconnect())
         future.add_done_callback(self._on_disconnect_done)
 
-    def _on_disconnect_done(self, future: Future[None]) -> None:
+    def _on_disconnect_done(self, future: asyncio.Future[None]) -> None:
         def update() -> None:
             try:
                 future.result()
@@ -740,61 +961,58 @@ class VeloxUI:
 
             self.connected = False
             self.status_var.set("Not connected")
-            self.connect_btn.config(state=tk.NORMAL)
-            self.disconnect_btn.config(state=tk.DISABLED)
-            self.stop_btn.config(state=tk.DISABLED)
+            self._set_state(self.connect_btn, tk.NORMAL)
+            self._set_state(self.disconnect_btn, tk.DISABLED)
+            self._set_state(self.stop_btn, tk.DISABLED)
             self._refresh_workout_buttons()
 
         self._call_ui(update)
 
     def _on_metrics(self, metrics: IndoorBikeData) -> None:
-        now = time.monotonic()
-        if self._last_metric_ts is not None and metrics.instantaneous_speed_kmh is not None:
-            dt = max(0.0, now - self._last_metric_ts)
-            self.distance_km += (metrics.instantaneous_speed_kmh * dt) / 3600.0
-        self._last_metric_ts = now
+        now_ns = time.monotonic_ns()
+        if self._last_metric_ns is not None and metrics.instantaneous_speed_kmh is not None:
+            self._distance_m_per_h_ns += round(metrics.instantaneous_speed_kmh * 1000.0) * (
+                now_ns - self._last_metric_ns
+            )
+        self._last_metric_ns = now_ns
 
         self.current_power_w = metrics.instantaneous_power
         self.current_cadence_rpm = metrics.instantaneous_cadence
         self.current_speed_kmh = metrics.instantaneous_speed_kmh
-        if metrics.instantaneous_power is not None:
-            self._sum_power_watts += metrics.instantaneous_power
-        if metrics.instantaneous_cadence is not None:
-            self._sum_cadence_rpm += metrics.instantaneous_cadence
-        if metrics.instantaneous_speed_kmh is not None:
-            self._sum_speed_kmh += metrics.instantaneous_speed_kmh
-        self._metric_sample_count += 1
+        self._metric_totals.add(metrics)
         self._update_zone_compliance()
 
-        def update() -> None:
-            self.power_var.set(
-                "Power: "
-                + (
-                    f"{metrics.instantaneous_power} W"
-                    if metrics.instantaneous_power is not None
-                    else "N/A"
-                )
-            )
-            self.cadence_var.set(
-                "Cadence: "
-                + (
-                    f"{metrics.instantaneous_cadence:.1f} rpm"
-                    if metrics.instantaneous_cadence is not None
-                    else "N/A"
-                )
-            )
-            self.speed_var.set(
-                "Speed: "
-                + (
-                    f"{metrics.instantaneous_speed_kmh:.1f} km/h"
-                    if metrics.instantaneous_speed_kmh is not None
-                    else "N/A"
-                )
+        # Runs on the Tk thread (see AsyncBridge) and opens no dialogs, so the
+        # labels are updated directly rather than through _call_ui.
+        power = metrics.instantaneous_power
+        cadence = metrics.instantaneous_cadence
+        speed = metrics.instantaneous_speed_kmh
+        if power is None:
+            self._set_text(self.power_var, "Power: N/A")
+        else:
+            self._recent_power.push(power)
+            self._set_text(
+                self.power_var, f"Power: {power} W (30s avg {self._recent_power.mean:.0f} W)"
             )
-            self.distance_var.set(f"Distance: {self.distance_km:.2f} km")
-            self._refresh_gauges()
+        self._set_text(
+            self.cadence_var,
+            "Cadence: " + (f"{cadence:.1f} rpm" if cadence is not None else "N/A"),
+        )
+        self._set_text(
+            self.speed_var, "Speed: " + (f"{speed:.1f} km/h" if speed is not None else "N/A")
+        )
+        self._set_text(self.distance_var, f"Distance: {self.distance_km:.2f} km")
+        self._schedule_gauge_redraw()
 
-        self._call_ui(update)
+    def _schedule_gauge_redraw(self) -> None:
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.root.after(self._redraw_interval_ms, self._flush_gauge_redraw)
+
+    def _flush_gauge_redraw(self) -> None:
+        self._redraw_pending = False
+        self._refresh_gauges()
 
     def on_load_preset(self) -> None:
         template_label = self.template_var.get()
@@ -829,61 +1047,111 @@ class VeloxUI:
         if not path:
             return
 
-        try:
-            plan = load_workout(path)
-        except WorkoutParseError as exc:
-            messagebox.showerror("Workout file", str(exc))
-            return
+        # Parsing a large file off the Tk thread keeps the window responsive.
+        source = os.path.basename(path)
+        previous_text = self.workout_var.get()
+        self._workout_load_seq += 1
+        self.workout_var.set(f"Loading workout: {source}...")
+        future = self.bridge.submit_blocking(load_workout, path)
+        future.add_done_callback(
+            partial(
+                self._on_load_workout_done, self._workout_load_seq, source, previous_text
+            )
+        )
+
+    def _on_load_workout_done(
+        self,
+        load_seq: int,
+        source: str,
+        previous_text: str,
+        future: asyncio.Future[WorkoutPlan],
+    ) -> None:
+        def update() -> None:
+            # A newer load or workout choice supersedes this result, error or not.
+            stale = load_seq != self._workout_load_seq
+            try:
+                plan = future.result()
+            except Exception as exc:
+                if stale:
+                    return
+                self.workout_var.set(previous_text)
+                messagebox.showerror("Workout file", str(exc))
+                return
 
-        self._set_workout(plan, source=Path(path).name)
+            if not stale:
+                self._set_workout(plan, source=source)
+
+        self._call_ui(update)
 
     def _set_workout(self, plan: WorkoutPlan, source: str) -> None:
+        self._workout_load_seq += 1
         self.workout = plan
         self.current_progress = None
         self._estimated_total_distance_km = self._estimate_total_distance_km(plan)
-        self._reset_zone_compliance()
+        self._prepare_curve_geometry(plan)
         self._reset_zone_compliance()
 
         self.workout_var.set(
             f"Workout: {plan.name} | source={source} | steps={len(plan.steps)} | "
-            f"total={self._format_time(plan.total_duration_sec)}"
+            f"total={_format_time(plan.total_duration_sec)}"
         )
-        self.steps_list.delete(0, tk.END)
+        rows = []
         for i, step in enumerate(plan.steps, start=1):
             label = step.label or f"Step {i}"
             cadence = ""
             if step.cadence_min_rpm is not None and step.cadence_max_rpm is not None:
                 cadence = f" | RPM {step.cadence_min_rpm}-{step.cadence_max_rpm}"
-            self.steps_list.insert(
-                tk.END,
+            rows.append(
                 f"{i:02d}. {label} | {step.target_watts}W{cadence} | "
-                f"{self._format_time(step.duration_sec)}",
+                f"{_format_time(step.duration_sec)}"
             )
+        if rows != self._step_rows:
+            self.steps_list.delete(0, tk.END)
+            if rows:
+                self.steps_list.insert(tk.END, *rows)
+            self._step_rows = rows
+            self._selected_step = 0
+        else:
+            self._select_step(0)
 
         self.progress.configure(value=0, maximum=max(1, plan.total_duration_sec))
+        self._painted_step_fields = None
         self.step_var.set("-")
         self.target_var.set("Target: -")
         self.rpm_objective_var.set("RPM objective: -")
-        self.step_timer_var.set("Step timer: -")
-        self.session_timer_var.set(
-            f"Session timer: 00:00 / {self._format_time(plan.total_duration_sec)}"
+        self._set_text(self.step_timer_var, "Step timer: -")
+        self._set_text(
+            self.session_timer_var,
+            f"Session timer: 00:00 / {_format_time(plan.total_duration_sec)}",
         )
         self._draw_workout_curve(plan)
         self._refresh_workout_buttons()
         self._refresh_gauges()
 
     def _estimate_total_distance_km(self, plan: WorkoutPlan) -> float:
-        total = 0.0
+        # Modelled speed is 14 + W/12 km/h clamped to 10..50, i.e. W clamped to
+        # -48..432. Summing 12 * speed * seconds stays in exact integers:
+        # (168 + W) watt-seconds per step, divided once at the end.
+        total = 0
         for step in plan.steps:
-            speed = max(10.0, min(50.0, 14.0 + (step.target_watts / 12.0)))
-            total += (speed * step.duration_sec) / 3600.0
-        return total
+            watts = step.target_watts
+            watts = -48 if watts < -48 else 432 if watts > 432 else watts
+            total += (168 + watts) * step.duration_sec
+        return total / (12.0 * 3600.0)
 
     def _refresh_workout_buttons(self) -> None:
         if self.connected and self.workout is not None:
-            self.start_btn.config(state=tk.NORMAL)
+            self._set_state(self.start_btn, tk.NORMAL)
         else:
-            self.start_btn.config(state=tk.DISABLED)
+            self._set_state(self.start_btn, tk.DISABLED)
+
+    def _prepare_curve_geometry(self, plan: WorkoutPlan) -> None:
+        # Size-independent chart data, derived once per plan.
+        self._curve_geometry_plan = plan
+        self._curve_prefix_sec = [0, *accumulate(step.duration_sec for step in plan.steps)]
+        self._curve_max_watts = max(
+            100, int(max(step.target_watts for step in plan.steps) * 1.15)
+        )
 
     def _draw_workout_curve(
         self,
@@ -893,12 +1161,9 @@ class VeloxUI:
         elapsed_total_sec: int = 0,
     ) -> None:
         canvas = self.chart_canvas
-        canvas.update_idletasks()
-        width = max(100, int(canvas.winfo_width()))
-        height = max(120, int(canvas.winfo_height()))
-
-        canvas.delete("all")
-        canvas.create_rectangle(0, 0, width, height, fill="#0f172a", outline="")
+        width, height = self._canvas_size(canvas)
+        width = max(100, width)
+        height = max(120, height)
 
         left_pad = 50
         right_pad = 20
@@ -906,58 +1171,119 @@ class VeloxUI:
         bottom_pad = 26
         plot_w = width - left_pad - right_pad
         plot_h = height - top_pad - bottom_pad
-        if plot_w <= 0 or plot_h <= 0:
-            return
-
-        max_watts = max(step.target_watts for step in plan.steps)
-        max_watts = max(100, int(max_watts * 1.15))
-
-        canvas.create_line(left_pad, top_pad, left_pad, top_pad + plot_h, fill="#64748b")
-        canvas.create_line(
-            left_pad,
-            top_pad + plot_h,
-            left_pad + plot_w,
-            top_pad + plot_h,
-            fill="#64748b",
-        )
+        if plan is not self._curve_geometry_plan:
+            self._prepare_curve_geometry(plan)
+        prefix_sec = self._curve_prefix_sec
+        total = prefix_sec[-1]
+
+        # The plan and canvas size fix everything but the active step colour and
+        # the elapsed cursor, so the scene is only rebuilt when either changes.
+        if self._curve_plan is not plan or self._curve_size != (width, height):
+            self._curve_plan = plan
+            self._curve_size = (width, height)
+            self._curve_bar_boxes = []
+            self._curve_active_item = None
+            self._curve_cursor_item = None
+            self._curve_active_step = None
+            self._curve_cursor_x = None
+
+            canvas.delete("all")
+            canvas.create_rectangle(0, 0, width, height, fill="#0f172a", outline="")
+            if plot_w <= 0 or plot_h <= 0:
+                return
 
-        for y_mark in (0.25, 0.5, 0.75, 1.0):
-            watts = int(max_watts * y_mark)
-            y = top_pad + plot_h - int(plot_h * y_mark)
-            canvas.create_line(left_pad, y, left_pad + plot_w, y, fill="#1e293b")
-            canvas.create_text(6, y, text=str(watts), anchor=tk.W, fill="#94a3b8")
+            max_watts = self._curve_max_watts
 
-        total = plan.total_duration_sec
-        elapsed = 0
-        for idx, step in enumerate(plan.steps, start=1):
-            x0 = left_pad + int((elapsed / total) * plot_w)
-            elapsed += step.duration_sec
-            x1 = left_pad + int((elapsed / total) * plot_w)
-            level = step.target_watts / max_watts
-            y = top_pad + plot_h - int(level * plot_h)
+            canvas.create_line(left_pad, top_pad, left_pad, top_pad + plot_h, fill="#64748b")
+            canvas.create_line(
+                left_pad,
+                top_pad + plot_h,
+                left_pad + plot_w,
+                top_pad + plot_h,
+                fill="#64748b",
+            )
 
-            fill = "#22c55e" if idx != active_step_index else "#f59e0b"
-            canvas.create_rectangle(x0, y, x1, top_pad + plot_h, fill=fill, outline="#0f172a")
+            for y_mark in (0.25, 0.5, 0.75, 1.0):
+                watts = int(max_watts * y_mark)
+                y = top_pad + plot_h - int(plot_h * y_mark)
+                canvas.create_line(left_pad, y, left_pad + plot_w, y, fill="#1e293b")
+                canvas.create_text(6, y, text=str(watts), anchor=tk.W, fill="#94a3b8")
+
+            # All step bars form one staircase polygon; the active step is a
+            # separate overlay rectangle moved onto the current bar.
+            base_y = top_pad + plot_h
+            profile = [left_pad, base_y]
+            for step, start_sec, end_sec in zip(plan.steps, prefix_sec, prefix_sec[1:]):
+                x0 = left_pad + int((start_sec / total) * plot_w)
+                x1 = left_pad + int((end_sec / total) * plot_w)
+                level = step.target_watts / max_watts
+                y = top_pad + plot_h - int(level * plot_h)
+                self._curve_bar_boxes.append((x0, y, x1, base_y))
+                profile += (x0, y, x1, y)
+            profile += (left_pad + plot_w, base_y)
+            canvas.create_polygon(profile, fill="#22c55e", outline="")
+            self._curve_active_item = canvas.create_rectangle(
+                left_pad,
+                base_y,
+                left_pad,
+                base_y,
+                fill="#f59e0b",
+                outline="#0f172a",
+                state=tk.HIDDEN,
+            )
 
-        if elapsed_total_sec > 0:
-            progress_x = left_pad + int((min(elapsed_total_sec, total) / total) * plot_w)
-            canvas.create_line(
-                progress_x,
+            self._curve_cursor_item = canvas.create_line(
+                left_pad,
                 top_pad,
-                progress_x,
+                left_pad,
                 top_pad + plot_h,
                 fill="#f8fafc",
                 width=2,
+                state=tk.HIDDEN,
             )
 
-        canvas.create_text(left_pad, height - 12, text="0", anchor=tk.W, fill="#94a3b8")
-        canvas.create_text(
-            left_pad + plot_w,
-            height - 12,
-            text=self._format_time(total),
-            anchor=tk.E,
-            fill="#94a3b8",
-        )
+            canvas.create_text(left_pad, height - 12, text="0", anchor=tk.W, fill="#94a3b8")
+            canvas.create_text(
+                left_pad + plot_w,
+                height - 12,
+                text=_format_time(total),
+                anchor=tk.E,
+                fill="#94a3b8",
+            )
+
+        cursor = self._curve_cursor_item
+        if cursor is None:
+            return
+
+        if active_step_index != self._curve_active_step:
+            active_item = self._curve_active_item
+            bar_boxes = self._curve_bar_boxes
+            if active_item is not None:
+                # Like the cursor, the overlay's state only changes on show/hide.
+                previous = self._curve_active_step
+                was_shown = previous is not None and 1 <= previous <= len(bar_boxes)
+                if active_step_index is not None and 1 <= active_step_index <= len(bar_boxes):
+                    canvas.coords(active_item, *bar_boxes[active_step_index - 1])
+                    if not was_shown:
+                        canvas.itemconfigure(active_item, state=tk.NORMAL)
+                elif was_shown:
+                    canvas.itemconfigure(active_item, state=tk.HIDDEN)
+            self._curve_active_step = active_step_index
+
+        # Long workouts move the cursor less than a pixel per tick; only touch
+        # the item when its pixel column (or visibility) actually changes.
+        progress_x: int | None = None
+        if elapsed_total_sec > 0:
+            progress_x = left_pad + int((min(elapsed_total_sec, total) / total) * plot_w)
+        if progress_x == self._curve_cursor_x:
+            return
+        if progress_x is None:
+            canvas.itemconfigure(cursor, state=tk.HIDDEN)
+        else:
+            canvas.coords(cursor, progress_x, top_pad, progress_x, top_pad + plot_h)
+            if self._curve_cursor_x is None:
+                canvas.itemconfigure(cursor, state=tk.NORMAL)
+        self._curve_cursor_x = progress_x
 
     def on_start_workout(self) -> None:
         if self.workout is None:
@@ -972,18 +1298,16 @@ class VeloxUI:
             messagebox.showerror("Workout", "FTP must be > 0")
             return
 
-        self.distance_km = 0.0
-        self._last_metric_ts = None
+        self._distance_m_per_h_ns = 0
+        self._last_metric_ns = None
         self._session_started_utc = now_utc_iso()
         self._session_mode = target_mode
         self._session_ftp_watts = ftp_watts
-        self._metric_sample_count = 0
-        self._sum_power_watts = 0.0
-        self._sum_cadence_rpm = 0.0
-        self._sum_speed_kmh = 0.0
+        self._metric_totals = _MetricTotals()
+        self._recent_power = _RollingMean(_RECENT_POWER_SAMPLES)
         self._reset_zone_compliance()
-        self.start_btn.config(state=tk.DISABLED)
-        self.stop_btn.config(state=tk.NORMAL)
+        self._set_state(self.start_btn, tk.DISABLED)
+        self._set_state(self.stop_btn, tk.NORMAL)
 
         future = self.bridge.submit(
             self.controller.start_workout(
@@ -996,12 +1320,12 @@ class VeloxUI:
         )
         future.add_done_callback(self._on_start_workout_done)
 
-    def _on_start_workout_done(self, future: Future[None]) -> None:
+    def _on_start_workout_done(self, future: asyncio.Future[None]) -> None:
         def update() -> None:
             try:
                 future.result()
             except Exception as exc:
-                self.stop_btn.config(state=tk.DISABLED)
+                self._set_state(self.stop_btn, tk.DISABLED)
                 self._refresh_workout_buttons()
                 messagebox.showerror("Workout", str(exc))
 
@@ -1012,61 +1336,106 @@ class VeloxUI:
 
     def _on_workout_progress(self, progress: WorkoutProgress) -> None:
         self.current_progress = progress
+        # Only the latest progress is painted: ticks arriving before the next
+        # paint (at most one per _PROGRESS_FRAME_NS) replace the pending one.
+        self._pending_progress = progress
+        if self._progress_paint_scheduled:
+            return
+        self._progress_paint_scheduled = True
+        since_paint_ns = time.monotonic_ns() - self._last_progress_paint_ns
+        if since_paint_ns < _PROGRESS_FRAME_NS:
+            wait_ms = (_PROGRESS_FRAME_NS - since_paint_ns) // 1_000_000 + 1
+            self.root.after(wait_ms, self._flush_progress)
+        else:
+            self.root.after_idle(self._flush_progress)
 
-        def update() -> None:
-            self.step_var.set(
-                f"Step {progress.step_index}/{progress.step_total}: {progress.step_label}"
-            )
-            self.target_var.set(
-                f"Target: {progress.target_display_value:.1f}{progress.target_display_unit} "
-                f"({progress.target_mode}, ref {progress.target_watts}W)"
+    def _flush_progress(self) -> None:
+        self._progress_paint_scheduled = False
+        progress = self._pending_progress
+        if progress is None:
+            return
+        self._pending_progress = None
+        self._last_progress_paint_ns = time.monotonic_ns()
+        self._paint_progress(progress)
+
+    def _paint_progress(self, progress: WorkoutProgress) -> None:
+        step_fields = (
+            progress.step_index,
+            progress.step_total,
+            progress.step_label,
+            progress.target_display_value,
+            progress.target_display_unit,
+            progress.target_mode,
+            progress.target_watts,
+            progress.expected_cadence_min_rpm,
+            progress.expected_cadence_max_rpm,
+        )
+        if step_fields != self._painted_step_fields:
+            self._painted_step_fields = step_fields
+            self._paint_step_labels(progress)
+
+        self._set_text(
+            self.step_timer_var,
+            "Step timer: "
+            f"{_format_time(progress.step_elapsed_sec)} / "
+            f"{_format_time(progress.step_duration_sec)} "
+            f"(remaining {_format_time(progress.remaining_sec)})",
+        )
+        self._set_text(
+            self.session_timer_var,
+            "Session timer: "
+            f"{_format_time(progress.elapsed_total_sec)} / "
+            f"{_format_time(progress.total_duration_sec)} "
+            f"(remaining {_format_time(progress.total_remaining_sec)})",
+        )
+        self.progress.configure(
+            maximum=max(1, progress.total_duration_sec),
+            value=progress.elapsed_total_sec,
+        )
+        self._select_step(progress.step_index)
+        if self.workout is not None:
+            self._draw_workout_curve(
+                self.workout,
+                active_step_index=progress.step_index,
+                elapsed_total_sec=progress.elapsed_total_sec,
             )
+        self._refresh_gauges()
 
-            if (
-                progress.expected_cadence_min_rpm is not None
-                and progress.expected_cadence_max_rpm is not None
-            ):
-                self.rpm_objective_var.set(
-                    "RPM objective: "
-                    f"{progress.expected_cadence_min_rpm}-"
-                    f"{progress.expected_cadence_max_rpm}"
-                )
-            else:
-                self.rpm_objective_var.set("RPM objective: free")
+    def _paint_step_labels(self, progress: WorkoutProgress) -> None:
+        self.step_var.set(
+            f"Step {progress.step_index}/{progress.step_total}: {progress.step_label}"
+        )
+        self.target_var.set(
+            f"Target: {progress.target_display_value:.1f}{progress.target_display_unit} "
+            f"({progress.target_mode}, ref {progress.target_watts}W)"
+        )
 
-            self.step_timer_var.set(
-                "Step timer: "
-                f"{self._format_time(progress.step_elapsed_sec)} / "
-                f"{self._format_time(progress.step_duration_sec)} "
-                f"(remaining {self._format_time(progress.remaining_sec)})"
-            )
-            self.session_timer_var.set(
-                "Session timer: "
-                f"{self._format_time(progress.elapsed_total_sec)} / "
-                f"{self._format_time(progress.total_duration_sec)} "
-                f"(remaining {self._format_time(progress.total_remaining_sec)})"
-            )
-            self.progress.configure(
-                maximum=max(1, progress.total_duration_sec),
-                value=progress.elapsed_total_sec,
+        if (
+            progress.expected_cadence_min_rpm is not None
+            and progress.expected_cadence_max_rpm is not None
+        ):
+            self.rpm_objective_var.set(
+                "RPM objective: "
+                f"{progress.expected_cadence_min_rpm}-"
+                f"{progress.expected_cadence_max_rpm}"
             )
-            self.steps_list.selection_clear(0, tk.END)
-            self.steps_list.selection_set(progress.step_index - 1)
-            self.steps_list.activate(progress.step_index - 1)
-            if self.workout is not None:
-                self._draw_workout_curve(
-                    self.workout,
-                    active_step_index=progress.step_index,
-                    elapsed_total_sec=progress.elapsed_total_sec,
-                )
-            self._refresh_gauges()
+        else:
+            self.rpm_objective_var.set("RPM objective: free")
 
-        self._call_ui(update)
+    def _select_step(self, step_index: int) -> None:
+        if step_index == self._selected_step:
+            return
+        self.steps_list.selection_clear(0, tk.END)
+        if step_index > 0:
+            self.steps_list.selection_set(step_index - 1)
+            self.steps_list.activate(step_index - 1)
+        self._selected_step = step_index
 
     def _on_workout_finish(self, completed: bool) -> None:
         def update() -> None:
+            self._pending_progress = None
             self._save_session(completed)
-            self.stop_btn.config(state=tk.DISABLED)
+            self._set_state(self.stop_btn, tk.DISABLED)
             self._refresh_workout_buttons()
             if completed:
                 self.status_var.set("Workout completed")
@@ -1083,6 +1452,8 @@ class VeloxUI:
             return
         planned = self.workout.total_duration_sec
         elapsed = self.current_progress.elapsed_total_sec if self.current_progress else 0
+        totals = self._metric_totals
+        power_hits, power_total, rpm_hits, rpm_total, both_hits, both_total = self._zone_counts
         record = SessionRecord(
             started_at_utc=self._session_started_utc or now_utc_iso(),
             ended_at_utc=now_utc_iso(),
@@ -1093,18 +1464,17 @@ class VeloxUI:
             planned_duration_sec=planned,
             elapsed_duration_sec=elapsed,
             distance_km=round(self.distance_km, 3),
-            avg_power_watts=self._avg(self._sum_power_watts, self._metric_sample_count),
-            avg_cadence_rpm=self._avg(self._sum_cadence_rpm, self._metric_sample_count),
-            avg_speed_kmh=self._avg(self._sum_speed_kmh, self._metric_sample_count),
-            power_compliance_pct=self._pct(self._zone_power_hits, self._zone_power_total),
-            rpm_compliance_pct=self._pct(self._zone_rpm_hits, self._zone_rpm_total),
-            both_compliance_pct=self._pct(self._zone_both_hits, self._zone_both_total),
+            avg_power_watts=_avg(totals.power_watts, totals.sample_count),
+            avg_cadence_rpm=_avg(totals.cadence_rpm, totals.sample_count),
+            avg_speed_kmh=_avg(totals.speed_kmh, totals.sample_count),
+            power_compliance_pct=_pct(power_hits, power_total),
+            rpm_compliance_pct=_pct(rpm_hits, rpm_total),
+            both_compliance_pct=_pct(both_hits, both_total),
         )
         append_session(record)
 
     def _on_close(self) -> None:
-        self.bridge.submit(self.controller.disconnect())
-        self.bridge.shutdown()
+        self.bridge.shutdown(self.controller.disconnect())
         self.root.destroy()
 
 
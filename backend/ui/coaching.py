@@ -8,7 +8,7 @@ from dataclasses import dataclass
 ActionKey = str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CoachingSignal:
     key: ActionKey
     text: str
@@ -16,24 +16,9 @@ class CoachingSignal:
     severity: str
 
 
-def compute_coaching_signal(
-    *,
-    power: int | None,
-    cadence: float | None,
-    expected_power_min: int | None,
-    expected_power_max: int | None,
-    expected_cadence_min: int | None,
-    expected_cadence_max: int | None,
+def _signal_for(
+    power_low: bool, power_high: bool, cadence_low: bool, cadence_high: bool
 ) -> CoachingSignal:
-    power_low = power is not None and expected_power_min is not None and power < expected_power_min
-    power_high = power is not None and expected_power_max is not None and power > expected_power_max
-    cadence_low = (
-        cadence is not None and expected_cadence_min is not None and cadence < expected_cadence_min
-    )
-    cadence_high = (
-        cadence is not None and expected_cadence_max is not None and cadence > expected_cadence_max
-    )
-
     if (power_low or power_high) and (cadence_low or cadence_high):
         power_hint = "↑ puissance" if power_low else "↓ puissance"
         cadence_hint = "↑ cadence" if cadence_low else "↓ cadence"
@@ -82,6 +67,33 @@ def compute_coaching_signal(
     )
 
 
+# Every signal indexed by the bits power_low, power_high, cadence_low,
+# cadence_high (most significant first); signals are immutable and shared.
+_SIGNAL_TABLE = tuple(
+    _signal_for(bool(i & 8), bool(i & 4), bool(i & 2), bool(i & 1)) for i in range(16)
+)
+
+
+def compute_coaching_signal(
+    *,
+    power: int | None,
+    cadence: float | None,
+    expected_power_min: int | None,
+    expected_power_max: int | None,
+    expected_cadence_min: int | None,
+    expected_cadence_max: int | None,
+) -> CoachingSignal:
+    power_low = power is not None and expected_power_min is not None and power < expected_power_min
+    power_high = power is not None and expected_power_max is not None and power > expected_power_max
+    cadence_low = (
+        cadence is not None and expected_cadence_min is not None and cadence < expected_cadence_min
+    )
+    cadence_high = (
+        cadence is not None and expected_cadence_max is not None and cadence > expected_cadence_max
+    )
+    return _SIGNAL_TABLE[power_low << 3 | power_high << 2 | cadence_low << 1 | cadence_high]
+
+
 class ActionStabilizer:
     """Avoid rapid action flicker when values oscillate around thresholds."""
 
@@ -103,10 +115,13 @@ class ActionStabilizer:
             self._pending_since = None
             return candidate, True
 
-        if candidate.key == self._current.key:
-            self._pending = None
-            self._pending_since = None
-            return self._current, False
+        current = self._current
+        # Signals come from a shared table, so the steady state is an identity hit.
+        if candidate is current or candidate.key == current.key:
+            if self._pending is not None:
+                self._pending = None
+                self._pending_since = None
+            return current, False
 
         if self._pending is None or self._pending.key != candidate.key:
             self._pending = candidate
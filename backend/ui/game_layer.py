@@ -8,6 +8,13 @@ from typing import Literal
 
 GoalKind = Literal["power", "cadence", "both"]
 
+# Zones a goal kind requires: (power in zone, cadence in zone).
+_KIND_REQUIREMENTS: dict[GoalKind, tuple[bool, bool]] = {
+    "power": (True, False),
+    "cadence": (False, True),
+    "both": (True, True),
+}
+
 
 @dataclass(frozen=True)
 class GoalDefinition:
@@ -18,7 +25,7 @@ class GoalDefinition:
     points: int
 
 
-@dataclass
+@dataclass(slots=True)
 class GoalProgress:
     definition: GoalDefinition
     progress_sec: float = 0.0
@@ -28,6 +35,7 @@ class GoalProgress:
 class GoalTracker:
     def __init__(self, goals: tuple[GoalDefinition, ...]) -> None:
         self._base_goals = goals
+        self._requirements = tuple(_KIND_REQUIREMENTS[goal.kind] for goal in goals)
         self.goals: list[GoalProgress] = []
         self.current_index: int = 0
         self.score: int = 0
@@ -48,18 +56,6 @@ class GoalTracker:
             return None
         return self.goals[self.current_index]
 
-    def _goal_condition(
-        self,
-        goal: GoalProgress,
-        power_in_zone: bool | None,
-        cadence_in_zone: bool | None,
-    ) -> bool:
-        if goal.definition.kind == "power":
-            return power_in_zone is True
-        if goal.definition.kind == "cadence":
-            return cadence_in_zone is True
-        return power_in_zone is True and cadence_in_zone is True
-
     def update(
         self,
         *,
@@ -67,13 +63,15 @@ class GoalTracker:
         cadence_in_zone: bool | None,
         dt_sec: float,
     ) -> None:
-        goal = self.current_goal
-        if goal is None:
-            return
-        if dt_sec <= 0:
+        index = self.current_index
+        if index >= len(self.goals) or dt_sec <= 0:
             return
+        goal = self.goals[index]
+        needs_power, needs_cadence = self._requirements[index]
 
-        if self._goal_condition(goal, power_in_zone, cadence_in_zone):
+        if (power_in_zone is True or not needs_power) and (
+            cadence_in_zone is True or not needs_cadence
+        ):
             goal.progress_sec += dt_sec
             self.streak += 1
         else:
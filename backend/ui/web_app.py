@@ -5,9 +5,11 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+import json
 import math
 import os
 from pathlib import Path
+import re
 import time
 from typing import Any, cast
 from uuid import uuid4
@@ -74,6 +76,40 @@ class WebState:
     ftp_watts: int = 220
 
 
+@dataclass(slots=True)
+class SessionAverages:
+    """Running sums of reported metrics; each field averages its own samples."""
+
+    power_sum: float = 0.0
+    power_count: int = 0
+    cadence_sum: float = 0.0
+    cadence_count: int = 0
+    speed_sum: float = 0.0
+    speed_count: int = 0
+
+    def add(self, power: int | None, cadence: float | None, speed: float | None) -> None:
+        if power is not None:
+            self.power_sum += power
+            self.power_count += 1
+        if cadence is not None:
+            self.cadence_sum += cadence
+            self.cadence_count += 1
+        if speed is not None:
+            self.speed_sum += speed
+            self.speed_count += 1
+
+    def clear(self) -> None:
+        self.power_sum = self.cadence_sum = self.speed_sum = 0.0
+        self.power_count = self.cadence_count = self.speed_count = 0
+
+    def averages(self) -> tuple[float | None, float | None, float | None]:
+        return (
+            self.power_sum / self.power_count if self.power_count else None,
+            self.cadence_sum / self.cadence_count if self.cadence_count else None,
+            self.speed_sum / self.speed_count if self.speed_count else None,
+        )
+
+
 @dataclass(frozen=True)
 class WorkoutOption:
     label: str
@@ -85,8 +121,13 @@ class WorkoutOption:
     avg_intensity_pct: int
 
 
+# Fixed-point format specs by digit count, so formatting skips building one.
+_NUMBER_SPECS = {digits: f".{digits}f" for digits in range(4)}
+
+
 def _fmt_number(value: float, digits: int = 1) -> str:
-    return f"{value:.{digits}f}".replace(".", ",")
+    spec = _NUMBER_SPECS.get(digits) or f".{digits}f"
+    return format(value, spec).replace(".", ",")
 
 
 def _fmt_power(value: int | None) -> str:
@@ -182,38 +223,22 @@ def _gauge_options(title: str, unit: str, max_value: int) -> dict[str, Any]:
     }
 
 
-def run_web_ui(
-    *,
-    simulate_ht: bool = False,
-    ble_pair: bool = True,
-    host: str = "127.0.0.1",
-    port: int = 8088,
-    start_delay_sec: int = 10,
-    ui_theme: str = "classic",
-) -> int:
-    global _ASSETS_MOUNTED
-    if not _ASSETS_MOUNTED:
-        try:
-            app.add_static_files(ASSETS_ROUTE, str(ASSETS_DIR))
-        except Exception:
-            # Route might already be mounted during hot reload.
-            pass
-        _ASSETS_MOUNTED = True
+# Asset URL placeholders used in the page HTML, filled in a single pass.
+_ASSET_URLS = {
+    "__SPRITE_URL__": SPRITE_URL,
+    "__SCENE_BG_URL__": SCENE_BG_URL,
+    "__DMD_CYCLIST_URL__": DMD_CYCLIST_URL,
+}
+_ASSET_URL_RE = re.compile("|".join(map(re.escape, _ASSET_URLS)))
 
-    controller = UIController(
-        debug_ftms=False,
-        simulate_ht=simulate_ht,
-        ble_pair=ble_pair,
-    )
-    state = WebState()
-    pinball_mode = ui_theme == "pinball"
-    csp_safe_mode = pinball_mode and os.getenv("VELOX_UI_CSP_SAFE", "").lower() in {
-        "1",
-        "true",
-        "yes",
-    }
-    ui.add_head_html(
-        """
+
+def _fill_asset_urls(html: str) -> str:
+    return _ASSET_URL_RE.sub(lambda match: _ASSET_URLS[match.group(0)], html)
+
+
+# Shared styles and scripts, built once at import rather than per run_web_ui call.
+_HEAD_HTML = _fill_asset_urls(
+    """
         <style>
           :root {
             --gb-bg: #0b1220;
@@ -477,7 +502,8 @@ def run_web_ui(
           .ve-dot.jackpot { color: #facc15; background: #facc15; }
         </style>
         <script>
-          window.veloxUpdateScene = function(speed, cadence, inZone, action) {
+          window.veloxUpdateScene = function(update) {
+            const { speed, cadence, inZone, action } = update || {};
             const scene = document.getElementById('ve-scene');
             if (!scene) return;
             const speedNode = document.getElementById('ve-scene-speed');
@@ -732,7 +758,7 @@ def run_web_ui(
               } else if (/Action:\\s*-/i.test(guidance)) {
                 inZone = false;
               }
-              window.veloxUpdateScene(speed, cadence, inZone, action);
+              window.veloxUpdateScene({ speed, cadence, inZone, action });
               if (window.veloxMiniGraph) {
                 window.veloxMiniGraph.push(parseVal('ve-kpi-power'), cadence);
               }
@@ -816,10 +842,40 @@ def run_web_ui(
           })();
         </script>
         """
-        .replace("__SPRITE_URL__", SPRITE_URL)
-        .replace("__SCENE_BG_URL__", SCENE_BG_URL)
-        .replace("__DMD_CYCLIST_URL__", DMD_CYCLIST_URL)
+)
+
+
+def run_web_ui(
+    *,
+    simulate_ht: bool = False,
+    ble_pair: bool = True,
+    host: str = "127.0.0.1",
+    port: int = 8088,
+    start_delay_sec: int = 10,
+    ui_theme: str = "classic",
+) -> int:
+    global _ASSETS_MOUNTED
+    if not _ASSETS_MOUNTED:
+        try:
+            app.add_static_files(ASSETS_ROUTE, str(ASSETS_DIR))
+        except Exception:
+            # Route might already be mounted during hot reload.
+            pass
+        _ASSETS_MOUNTED = True
+
+    controller = UIController(
+        debug_ftms=False,
+        simulate_ht=simulate_ht,
+        ble_pair=ble_pair,
     )
+    state = WebState()
+    pinball_mode = ui_theme == "pinball"
+    csp_safe_mode = pinball_mode and os.getenv("VELOX_UI_CSP_SAFE", "").lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+    ui.add_head_html(_HEAD_HTML)
 
     templates = list_templates()
     workout_options: list[WorkoutOption] = []
@@ -856,7 +912,7 @@ def run_web_ui(
     timeline_actual_power: list[int | None] = []
     timeline_actual_cadence: list[float | None] = []
     timeline_step_ranges: list[tuple[int, int, str]] = []
-    metric_samples: list[tuple[int | None, float | None, float | None]] = []
+    session_averages = SessionAverages()
 
     with ui.column().classes("w-full gap-2") as setup_header:
         with ui.row().classes("w-full items-center justify-between gap-2"):
@@ -1333,15 +1389,6 @@ def run_web_ui(
                 return label
         return "-"
 
-    def _compute_session_averages() -> tuple[float | None, float | None, float | None]:
-        power_values = [float(p) for p, _, _ in metric_samples if p is not None]
-        cadence_values = [c for _, c, _ in metric_samples if c is not None]
-        speed_values = [s for _, _, s in metric_samples if s is not None]
-        avg_power = sum(power_values) / len(power_values) if power_values else None
-        avg_cadence = sum(cadence_values) / len(cadence_values) if cadence_values else None
-        avg_speed = sum(speed_values) / len(speed_values) if speed_values else None
-        return avg_power, avg_cadence, avg_speed
-
     def _compute_both_compliance_pct() -> float | None:
         point_total = min(len(timeline_actual_power), len(timeline_actual_cadence))
         if point_total <= 0:
@@ -1391,7 +1438,7 @@ def run_web_ui(
         power_pct = pct(zone_compliance["power_ok"], zone_compliance["power_total"])
         rpm_pct = pct(zone_compliance["rpm_ok"], zone_compliance["rpm_total"])
         both_pct = _compute_both_compliance_pct()
-        avg_power, avg_cadence, avg_speed = _compute_session_averages()
+        avg_power, avg_cadence, avg_speed = session_averages.averages()
 
         points: list[SessionPoint] = []
         for idx, expected_power in enumerate(timeline_expected_power):
@@ -2073,14 +2120,13 @@ def run_web_ui(
                             "window.veloxCoachCue("
                             "'coach', 'Stable, continue', 1600);"
                         )
-        _safe_run_js(
-            "window.veloxUpdateScene("
-            f"{state.speed if state.speed is not None else 0},"
-            f"{state.cadence if state.cadence is not None else 0},"
-            f"{'true' if in_zone_for_scene else 'false'},"
-            f"'{scene_action}'"
-            ");"
-        )
+        scene_update = {
+            "speed": state.speed if state.speed is not None else 0,
+            "cadence": state.cadence if state.cadence is not None else 0,
+            "inZone": in_zone_for_scene,
+            "action": scene_action,
+        }
+        _safe_run_js(f"window.veloxUpdateScene({json.dumps(scene_update)});")
 
         p = pct(zone_compliance["power_ok"], zone_compliance["power_total"])
         r = pct(zone_compliance["rpm_ok"], zone_compliance["rpm_total"])
@@ -2348,12 +2394,10 @@ def run_web_ui(
             state.heart_rate_bpm = int(round(hm_sim_seed))
         else:
             state.heart_rate_bpm = None
-        metric_samples.append(
-            (
-                metrics.instantaneous_power,
-                metrics.instantaneous_cadence,
-                metrics.instantaneous_speed_kmh,
-            )
+        session_averages.add(
+            metrics.instantaneous_power,
+            metrics.instantaneous_cadence,
+            metrics.instantaneous_speed_kmh,
         )
 
         if state.progress:
@@ -2440,7 +2484,7 @@ def run_web_ui(
         ended_workout_name = state.workout.name if state.workout is not None else "-"
         elapsed_sec = state.progress.elapsed_total_sec if state.progress is not None else 0
         both_pct = _compute_both_compliance_pct()
-        avg_power, avg_cadence, avg_speed = _compute_session_averages()
+        avg_power, avg_cadence, avg_speed = session_averages.averages()
         _save_session_snapshot(completed)
         state.progress = None
         state.status = "Workout completed" if completed else "Workout stopped"
@@ -2487,7 +2531,7 @@ def run_web_ui(
         build_expected_timeline()
         state.distance_km = 0.0
         state.last_ts = None
-        metric_samples.clear()
+        session_averages.clear()
         coaching_stabilizer.reset()
         goal_tracker.reset()
         pinball_score_bonus = 0
@@ -218,7 +218,11 @@ TEMPLATES: tuple[WorkoutTemplate, ...] = (
 )
 
 
+_TEMPLATES_BY_KEY: dict[str, WorkoutTemplate] = {template.key: template for template in TEMPLATES}
+
+
 def list_templates() -> tuple[WorkoutTemplate, ...]:
+    """Return the shared, immutable template tuple; callers need not cache it."""
     return TEMPLATES
 
 
@@ -239,7 +243,7 @@ def build_plan_from_template(template_key: str, ftp_watts: int) -> WorkoutPlan:
     if ftp_watts <= 0:
         raise ValueError("FTP must be > 0")
 
-    template = next((item for item in TEMPLATES if item.key == template_key), None)
+    template = _TEMPLATES_BY_KEY.get(template_key)
     if template is None:
         raise ValueError(f"Unknown workout template '{template_key}'")
 
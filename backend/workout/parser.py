@@ -5,6 +5,7 @@ from __future__ import annotations
 import csv
 import json
 from pathlib import Path
+from typing import Iterator
 
 from backend.workout.model import WorkoutPlan, WorkoutStep
 
@@ -25,6 +26,18 @@ def load_workout(path: str | Path) -> WorkoutPlan:
     )
 
 
+def load_workout_iter(path: str | Path) -> Iterator[WorkoutStep]:
+    """Yield the steps of a workout file, parsing CSV rows as they are read.
+
+    A bad CSV header or row raises when iteration reaches it; JSON files are
+    parsed whole up front. Unlike ``load_workout`` an empty CSV yields nothing.
+    """
+    file_path = Path(path)
+    if file_path.suffix.lower() == ".csv":
+        return _iter_csv_steps(file_path)
+    return iter(load_workout(file_path).steps)
+
+
 def _load_json(path: Path) -> WorkoutPlan:
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
@@ -61,7 +74,10 @@ def _load_json(path: Path) -> WorkoutPlan:
 
 
 def _load_csv(path: Path) -> WorkoutPlan:
-    rows: list[WorkoutStep] = []
+    return _build_plan(name=path.stem, steps=list(_iter_csv_steps(path)))
+
+
+def _iter_csv_steps(path: Path) -> Iterator[WorkoutStep]:
     with path.open("r", encoding="utf-8", newline="") as handle:
         reader = csv.DictReader(handle)
         fields = set(reader.fieldnames or [])
@@ -73,19 +89,15 @@ def _load_csv(path: Path) -> WorkoutPlan:
             )
 
         for i, row in enumerate(reader):
-            rows.append(
-                _build_step(
-                    duration_obj=row.get("duration_sec"),
-                    watts_obj=row.get("target_watts"),
-                    label_obj=row.get("label"),
-                    cadence_min_obj=row.get("cadence_min_rpm"),
-                    cadence_max_obj=row.get("cadence_max_rpm"),
-                    index=i,
-                )
+            yield _build_step(
+                duration_obj=row.get("duration_sec"),
+                watts_obj=row.get("target_watts"),
+                label_obj=row.get("label"),
+                cadence_min_obj=row.get("cadence_min_rpm"),
+                cadence_max_obj=row.get("cadence_max_rpm"),
+                index=i,
             )
 
-    return _build_plan(name=path.stem, steps=rows)
-
 
 def _build_step(
     *,
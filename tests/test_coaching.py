@@ -35,6 +35,19 @@ def test_compute_coaching_signal_priority() -> None:
     assert s3.key == "cadence_low"
 
 
+def test_compute_coaching_signal_reuses_shared_signals() -> None:
+    kwargs = dict(
+        expected_power_min=180,
+        expected_power_max=200,
+        expected_cadence_min=85,
+        expected_cadence_max=95,
+    )
+    first = compute_coaching_signal(power=150, cadence=100.0, **kwargs)
+    second = compute_coaching_signal(power=120, cadence=110.0, **kwargs)
+    assert first.key == "dual_pl_ch"
+    assert first is second
+
+
 def test_action_stabilizer_anti_flicker() -> None:
     stab = ActionStabilizer(min_switch_sec=2.0)
     ok = compute_coaching_signal(
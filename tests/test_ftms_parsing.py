@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import struct
 
+import pytest
+
 from backend.ble.constants import parse_indoor_bike_flags
-from backend.ble.ftms_client import FTMSClient, normalize_power_target, parse_indoor_bike_data
+from backend.ble.ftms_client import (
+    FTMSClient,
+    IndoorBikeData,
+    _resolve_manufacturer,
+    normalize_power_target,
+    parse_indoor_bike_data,
+)
 
 
 def test_parse_indoor_bike_flags_power_and_cadence_present() -> None:
@@ -106,6 +115,196 @@ def test_normalize_power_target_clamps_to_supported_range() -> None:
     assert normalize_power_target(420, 30, 400, 5) == 400
 
 
+def test_normalize_power_target_caps_at_off_grid_max() -> None:
+    assert normalize_power_target(995, 0, 998, 10) == 998
+    assert normalize_power_target(1200, 0, 998, 10) == 998
+    assert normalize_power_target(994, 0, 998, 10) == 990
+
+
 def test_normalize_power_target_aligns_to_increment() -> None:
     assert normalize_power_target(33, 30, 400, 5) == 35
     assert normalize_power_target(32, 30, 400, 5) == 30
+
+
+def test_parse_indoor_bike_flags_ignores_reserved_bits() -> None:
+    flags = parse_indoor_bike_flags(0xE044)
+    assert flags == parse_indoor_bike_flags(0x0044)
+    assert flags.remaining_time_present is False
+
+
+def test_parse_indoor_bike_flags_maps_each_bit_to_its_field() -> None:
+    assert parse_indoor_bike_flags(1 << 0).more_data is True
+    assert parse_indoor_bike_flags(1 << 9).heart_rate_present is True
+    assert parse_indoor_bike_flags(1 << 12).remaining_time_present is True
+    assert parse_indoor_bike_flags(1 << 12).elapsed_time_present is False
+
+
+def test_parse_indoor_bike_data_cadence_resistance_power_heart_rate() -> None:
+    payload = (
+        struct.pack("<H", 0x0264)
+        + struct.pack("<H", 3200)  # 32.00 km/h instantaneous speed
+        + struct.pack("<H", 180)   # 90.0 rpm cadence
+        + struct.pack("<h", 12)    # resistance level
+        + struct.pack("<h", 215)   # 215 W
+        + struct.pack("<B", 142)   # heart rate
+    )
+
+    data = parse_indoor_bike_data(payload)
+
+    assert data.instantaneous_speed_kmh == 32.0
+    assert data.instantaneous_cadence == 90.0
+    assert data.instantaneous_power == 215
+
+
+def test_resolve_manufacturer_from_name_hint() -> None:
+    assert _resolve_manufacturer("Elite DIRETO XRT", None) == "Elite"
+    assert _resolve_manufacturer("KICKR CORE 5A1B", {}) == "Wahoo Fitness"
+    assert _resolve_manufacturer("Heart Strap", None) is None
+
+
+def test_resolve_manufacturer_prefers_earlier_hint_over_leftmost() -> None:
+    assert _resolve_manufacturer("Zwift Hub by Wahoo", None) == "Wahoo Fitness"
+    assert _resolve_manufacturer("stagesaris", None) == "Saris"
+
+
+def test_publish_merged_metrics_coalesces_duplicate_burst() -> None:
+    client = FTMSClient()
+    published: list[object] = []
+    client._set_metrics_callback(published.append)
+
+    client._handle_indoor_bike_data_notification(
+        None, bytearray(struct.pack("<HHHh", 0x0044, 3000, 176, 182))
+    )
+    client._handle_cycling_power_measurement_notification(
+        None, bytearray(struct.pack("<Hh", 0x0000, 182))
+    )
+    client._handle_indoor_bike_data_notification(
+        None, bytearray(struct.pack("<HHHh", 0x0044, 3000, 176, 190))
+    )
+
+    assert len(published) == 2
+
+
+def test_metrics_callback_returning_a_coroutine_is_awaited(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    async def _run() -> None:
+        client = FTMSClient()
+        received: list[IndoorBikeData] = []
+
+        async def record(data: IndoorBikeData) -> None:
+            received.append(data)
+            raise ValueError("boom")
+
+        client._set_metrics_callback(lambda data: record(data))
+        for watts in (182, 190, 200):
+            client._handle_indoor_bike_data_notification(
+                None, bytearray(struct.pack("<HHHh", 0x0044, 3000, 176, watts))
+            )
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert [data.instantaneous_power for data in received] == [182, 190, 200]
+        await client._stop_metrics_consumer()
+
+    asyncio.run(_run())
+    assert capsys.readouterr().out.count("metrics callback failed") == 1
+
+
+def test_normalize_power_target_never_rounds_past_max() -> None:
+    assert normalize_power_target(35, 30, 400, 10) == 40
+    assert normalize_power_target(403, 30, 403, 5) == 403
+
+
+def test_supported_power_range_read_lazily_and_cached() -> None:
+    class _FakeBleakClient:
+        is_connected = True
+        services: object = None
+
+        def __init__(self) -> None:
+            self.reads = 0
+
+        async def read_gatt_char(self, _uuid: str) -> bytearray:
+            self.reads += 1
+            return bytearray(struct.pack("<hhH", 30, 400, 5))
+
+    async def _run() -> None:
+        fake = _FakeBleakClient()
+        client = FTMSClient()
+        client._client = fake
+
+        await client._ensure_services_discovered()
+        assert fake.reads == 0
+
+        assert await client._normalize_target_power(33) == 35
+        assert await client._normalize_target_power(500) == 400
+        assert fake.reads == 1
+
+    asyncio.run(_run())
+
+
+def test_missing_supported_power_range_is_not_read_again() -> None:
+    class _FakeBleakClient:
+        is_connected = True
+
+        def __init__(self) -> None:
+            self.reads = 0
+
+        async def read_gatt_char(self, _uuid: str) -> bytearray:
+            self.reads += 1
+            raise RuntimeError("characteristic not found")
+
+    async def _run() -> None:
+        fake = _FakeBleakClient()
+        client = FTMSClient()
+        client._client = fake
+
+        assert await client._normalize_target_power(203) == 203
+        assert await client._normalize_target_power(207) == 207
+        assert fake.reads == 1
+
+    asyncio.run(_run())
+
+
+def test_set_target_power_skips_unacknowledged_writes_on_write_only_control_point() -> None:
+    class _FakeCharacteristic:
+        def __init__(self, properties: list[str]) -> None:
+            self.properties = properties
+
+    class _FakeServices:
+        def __init__(self, properties: list[str]) -> None:
+            self._characteristic = _FakeCharacteristic(properties)
+
+        def get_characteristic(self, _uuid: str) -> _FakeCharacteristic:
+            return self._characteristic
+
+    class _FakeBleakClient:
+        is_connected = True
+
+        def __init__(self, properties: list[str]) -> None:
+            self.services = _FakeServices(properties)
+            self.writes: list[tuple[int, bool]] = []
+
+        async def start_notify(self, _uuid: str, _callback: object) -> None:
+            return None
+
+        async def read_gatt_char(self, _uuid: str) -> bytearray:
+            return bytearray(struct.pack("<hhH", 0, 1000, 1))
+
+        async def write_gatt_char(self, _uuid: str, data: bytes, response: bool) -> None:
+            self.writes.append((data[0], response))
+
+    async def _run(properties: list[str]) -> list[tuple[int, bool]]:
+        fake = _FakeBleakClient(properties)
+        client = FTMSClient()
+        client._client = fake
+        assert await client.set_target_power(200) == 200
+        return fake.writes
+
+    write_only = asyncio.run(_run(["write", "indicate"]))
+    assert write_only == [(0x00, True), (0x07, True), (0x05, True)]
+
+    with_unacknowledged = asyncio.run(
+        _run(["write", "write-without-response", "indicate"])
+    )
+    assert with_unacknowledged == [(0x00, False), (0x07, False), (0x05, True)]
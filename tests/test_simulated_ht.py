@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 
-from backend.ble.ftms_client import FTMSClient, IndoorBikeData
+from backend.ble.ftms_client import FTMSClient, IndoorBikeData, _sim_step
 
 
 async def _wait_for_metrics(client: FTMSClient, samples: list[IndoorBikeData]) -> None:
@@ -63,3 +63,51 @@ def test_simulated_resistance_and_slope() -> None:
         await client.disconnect()
 
     asyncio.run(_run())
+
+
+def test_simulated_async_callback_is_fed_from_queue() -> None:
+    async def _run() -> None:
+        client = FTMSClient(simulate_ht=True)
+        await client.connect(target="auto")
+
+        samples: list[IndoorBikeData] = []
+
+        async def on_metrics(data: IndoorBikeData) -> None:
+            samples.append(data)
+
+        await client.subscribe_indoor_bike_data(on_metrics)
+        await asyncio.sleep(0.1)
+        assert len(samples) == 1
+        consumer = client._metrics_consumer_task
+        assert consumer is not None and not consumer.done()
+
+        await client.disconnect()
+        assert consumer.cancelled()
+        assert client._metrics_consumer_task is None
+
+    asyncio.run(_run())
+
+
+def test_simulate_ticks_matches_tick_by_tick() -> None:
+    batched = FTMSClient(simulate_ht=True)
+    stepped = FTMSClient(simulate_ht=True)
+
+    samples = batched._simulate_ticks(600)
+    assert len(samples) == 600
+    assert samples == [stepped._simulate_ticks(1)[0] for _ in range(600)]
+    assert all(50 <= (sample.instantaneous_power or 0) <= 1200 for sample in samples)
+
+
+def test_sim_step_limits_rate_and_range() -> None:
+    power, cadence, speed = _sim_step(
+        100.0, 85.0, 28.0, 1200, 0.0, 0.0, 0.0, 0.0, (0.0, 0.0, 0.0)
+    )
+    assert power == 130.0
+    assert 45.0 <= cadence <= 128.0
+    assert 7.0 <= speed <= 78.0
+
+    # Target below the 50 W floor: power settles exactly on the floor.
+    power, _cadence, _speed = _sim_step(
+        50.5, 85.0, 28.0, 0, -40.0, 0.0, 0.0, 0.0, (-6.0, 0.0, 0.0)
+    )
+    assert power == 50.0
@@ -23,6 +23,10 @@ def test_duration_templates_exist() -> None:
     assert "endurance_60" in keys
 
 
+def test_list_templates_returns_the_shared_tuple() -> None:
+    assert list_templates() is list_templates()
+
+
 def test_inferred_cadence_is_present_and_correlated_with_intensity() -> None:
     plan = build_plan_from_template("tempo_30", ftp_watts=240)
     warmup = plan.steps[0]
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from backend.workout.parser import WorkoutParseError, load_workout
+from backend.workout.parser import WorkoutParseError, load_workout, load_workout_iter
 
 
 def test_load_workout_json(tmp_path: Path) -> None:
@@ -73,3 +73,18 @@ def test_load_workout_invalid_value(tmp_path: Path) -> None:
 
     with pytest.raises(WorkoutParseError):
         load_workout(workout_file)
+
+
+def test_load_workout_iter_streams_csv_rows(tmp_path: Path) -> None:
+    workout_file = tmp_path / "long.csv"
+    workout_file.write_text(
+        "duration_sec,target_watts\n60,100\n90,150\nbad,200\n",
+        encoding="utf-8",
+    )
+
+    steps = load_workout_iter(workout_file)
+
+    assert next(steps).target_watts == 100
+    assert next(steps).duration_sec == 90
+    with pytest.raises(WorkoutParseError, match="Step 3"):
+        next(steps)